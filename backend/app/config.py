@@ -1,7 +1,7 @@
 from pydantic_settings import BaseSettings
-from typing import List, Union
+from typing import ClassVar, FrozenSet, List, Union
 from pydantic import field_validator
-import os
+from functools import cached_property
 
 class Settings(BaseSettings):
     # Database
@@ -25,8 +25,15 @@ class Settings(BaseSettings):
     upload_dir: str = "./uploads"
     max_file_size: int = 10485760  # 10MB
     
+    # Dashboard insights cache lifetime in seconds
+    dashboard_cache_ttl: int = 10
+    
+    # Number of Textract results kept in memory, keyed by PDF content hash
+    textract_cache_size: int = 64
+    
     # CORS - can be comma-separated string or list
     allowed_origins: Union[str, List[str]] = "http://localhost:3000,http://127.0.0.1:3000"
+    allow_methods_bytes: ClassVar[bytes] = b"GET, POST, PUT, DELETE, OPTIONS"
     
     @field_validator('allowed_origins', mode='before')
     @classmethod
@@ -36,11 +43,13 @@ class Settings(BaseSettings):
             return [origin.strip() for origin in v.split(',') if origin.strip()]
         return v
     
+    @cached_property
+    def allowed_origins_set(self) -> FrozenSet[str]:
+        """Allowed origins as a frozenset, built once for O(1) lookups in the CORS middleware"""
+        return frozenset(self.allowed_origins)
+    
     class Config:
         env_file = ".env"
         case_sensitive = False
 
 settings = Settings()
-
-# Create upload directory if it doesn't exist
-os.makedirs(settings.upload_dir, exist_ok=True)
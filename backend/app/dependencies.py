@@ -0,0 +1,35 @@
+from functools import lru_cache
+from fastapi import Depends
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.services.alert_service import AlertService
+from app.services.chat_service import ChatService
+from app.services.document_service import DocumentService
+from app.services.exception_service import ExceptionService
+from app.services.pdf_processor import PDFProcessor
+from app.services.upload_service import UploadService
+
+# Request-scoped services: one instance per request, sharing the request's DB session
+
+def get_document_service(db: Session = Depends(get_db)) -> DocumentService:
+    return DocumentService(db)
+
+def get_alert_service(db: Session = Depends(get_db)) -> AlertService:
+    return AlertService(db)
+
+def get_exception_service(db: Session = Depends(get_db)) -> ExceptionService:
+    return ExceptionService(db)
+
+# App-scoped singletons: PDFProcessor builds boto3 clients and ChatService an OpenAI client,
+# so each is created once on first use
+
+@lru_cache(maxsize=None)
+def get_pdf_processor() -> PDFProcessor:
+    return PDFProcessor()
+
+@lru_cache(maxsize=None)
+def get_chat_service() -> ChatService:
+    return ChatService()
+
+def get_upload_service() -> UploadService:
+    return UploadService(pdf_processor=get_pdf_processor())
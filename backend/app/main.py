@@ -1,8 +1,10 @@
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
+import os
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse
 from app.config import settings
 from app.database import engine
+from app.middleware import PureASGICORSMiddleware
+from app.static_files import UploadFilesApp
 from app.models import Base
 from app.routers import dashboard, documents, exceptions, alerts, chat, uploads, processed_documents
 
@@ -13,20 +15,38 @@ Base.metadata.create_all(bind=engine)
 app = FastAPI(
     title="DMS Dashboard API",
     description="Document Management System API",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.allowed_origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    PureASGICORSMiddleware,
+    allow_origins=settings.allowed_origins_set,
+    allow_methods=settings.allow_methods_bytes,
 )
 
+@app.on_event("startup")
+async def create_upload_dir():
+    # Create upload directory if it doesn't exist
+    os.makedirs(settings.upload_dir, exist_ok=True)
+
+# Unhandled errors become a JSON 500 in one place instead of per-route try/except wrappers
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    headers = {}
+    # This handler runs outside the CORS middleware, so add the headers browsers need to read the error
+    origin = request.headers.get("origin")
+    if origin and (origin in settings.allowed_origins_set or "*" in settings.allowed_origins_set):
+        headers = {
+            "access-control-allow-origin": origin,
+            "access-control-allow-credentials": "true",
+            "vary": "Origin",
+        }
+    return ORJSONResponse({"detail": f"Internal error: {exc}"}, status_code=500, headers=headers)
+
 # Mount static files for uploads
-app.mount("/uploads", StaticFiles(directory=settings.upload_dir), name="uploads")
+app.mount("/uploads", UploadFilesApp(directory=settings.upload_dir), name="uploads")
 
 # Include routers
 app.include_router(dashboard.router)
@@ -0,0 +1,115 @@
+from typing import Iterable, List, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+Headers = List[Tuple[bytes, bytes]]
+
+
+class PureASGICORSMiddleware:
+    """Minimal CORS middleware written directly against the ASGI interface.
+
+    Mirrors the subset of Starlette's CORSMiddleware behaviour this API relies on
+    (explicit origin allow-list, credentials, any method/header) but keeps all
+    header values pre-encoded so the per-request work is a header lookup and a
+    list append.
+
+    Browsers do not treat ``*`` as a wildcard for credentialed requests, so the
+    allowed methods are listed explicitly and requested headers are echoed back.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow_origins: Iterable[str] = (),
+        allow_methods: bytes = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT",
+        allow_headers: bytes = b"*",
+        max_age: int = 600,
+    ):
+        self.app = app
+        self._allow_origins_set = frozenset(allow_origins)
+        self._allow_all_origins = "*" in self._allow_origins_set
+        self._allow_methods_bytes = allow_methods
+        self._allow_headers_bytes = allow_headers
+        self._allow_credentials_bytes = b"true"
+
+        # Static headers shared by every preflight response
+        self._preflight_headers: Headers = [
+            (b"access-control-allow-methods", self._allow_methods_bytes),
+            (b"access-control-allow-credentials", self._allow_credentials_bytes),
+            (b"access-control-max-age", str(max_age).encode("latin-1")),
+            (b"vary", b"Origin"),
+        ]
+        # Static headers appended to simple (non-preflight) responses
+        self._simple_headers: Headers = [
+            (b"access-control-allow-credentials", self._allow_credentials_bytes),
+            (b"vary", b"Origin"),
+        ]
+
+    def _is_allowed_origin(self, origin: bytes) -> bool:
+        return self._allow_all_origins or origin.decode("latin-1") in self._allow_origins_set
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin: Optional[bytes] = None
+        request_method: Optional[bytes] = None
+        request_headers: Optional[bytes] = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._preflight_response(origin, request_headers, send)
+            return
+
+        if not self._is_allowed_origin(origin):
+            await self.app(scope, receive, send)
+            return
+
+        origin_header = (b"access-control-allow-origin", origin)
+        simple_headers = self._simple_headers
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Build a new list: the response's own raw_headers must not be mutated
+                message["headers"] = [*message.get("headers", ()), origin_header, *simple_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def _preflight_response(self, origin: bytes, request_headers: Optional[bytes], send: Send) -> None:
+        """Answer a CORS preflight request without invoking the downstream app"""
+        if not self._is_allowed_origin(origin):
+            body = b"Disallowed CORS origin"
+            await send({
+                "type": "http.response.start",
+                "status": 400,
+                "headers": [
+                    (b"content-type", b"text/plain; charset=utf-8"),
+                    (b"content-length", str(len(body)).encode("latin-1")),
+                    (b"vary", b"Origin"),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        headers: Headers = [(b"access-control-allow-origin", origin)]
+        headers.extend(self._preflight_headers)
+        if request_headers:
+            # Any header is allowed, so echo back what the browser asked for
+            headers.append((b"access-control-allow-headers", request_headers))
+        elif self._allow_headers_bytes != b"*":
+            headers.append((b"access-control-allow-headers", self._allow_headers_bytes))
+
+        await send({"type": "http.response.start", "status": 204, "headers": headers})
+        await send({"type": "http.response.body", "body": b""})
@@ -1,12 +1,26 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, SmallInteger, String, Float, DateTime, Text, Boolean, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
+import uuid
+
+# Sort rank for alert levels: critical first, unknown levels last
+ALERT_LEVEL_RANKS = {"critical": 1, "warning": 2, "info": 3}
+
+def alert_level_rank(level: str) -> int:
+    return ALERT_LEVEL_RANKS.get(level, 4)
+
+def _default_level_rank(context) -> int:
+    return alert_level_rank(context.get_current_parameters().get("level"))
+
+def new_id() -> str:
+    """Primary key for new rows: a random UUID as 32 hex characters"""
+    return uuid.uuid4().hex
 
 class Document(Base):
     __tablename__ = "documents"
     
-    id = Column(String, primary_key=True, index=True)
+    id = Column(String, primary_key=True, index=True, default=new_id)
     title = Column(String, nullable=False)
     category = Column(String, nullable=False)  # Client PO, Vendor PO, Client Invoice, Vendor Invoice, Service Agreement
     client = Column(String, nullable=False)
@@ -23,11 +37,25 @@ class Document(Base):
     processed = Column(Boolean, default=False)
     po_number = Column(String, nullable=True, index=True)  # PO number for linking invoices to POs
     invoice_number = Column(String, nullable=True, index=True)  # Invoice number for reference
+    ingest_at = Column(DateTime(timezone=True), nullable=True)  # Processing of the uploaded PDF started
+    validated_at = Column(DateTime(timezone=True), nullable=True)  # Saved with its alerts generated
+    
+    __table_args__ = (
+        Index("ix_documents_status_created", "status", "created_at"),
+        Index("ix_documents_category_client", "category", "client"),
+        # Lookups used by DocumentLinkingService
+        Index("ix_doc_cat_pono", "category", "po_number"),
+        Index("ix_doc_cat_client_vendor_created", "category", "client", "vendor", "created_at"),
+        Index("ix_doc_cat_client_amount", "category", "client", "currency", "amount"),
+        Index("ix_doc_linked_to_cat", "linked_to", "category"),
+        # Dashboard utilization trend: per-category created_at range, amount read from the index
+        Index("ix_documents_category_created_amount", "category", "created_at", "amount"),
+    )
 
 class Exception(Base):
     __tablename__ = "exceptions"
     
-    id = Column(String, primary_key=True, index=True)
+    id = Column(String, primary_key=True, index=True, default=new_id)
     document_id = Column(String, ForeignKey("documents.id"), nullable=False)
     issue = Column(Text, nullable=False)
     severity = Column(String, nullable=False)  # low, medium, high
@@ -35,23 +63,36 @@ class Exception(Base):
     raised_at = Column(DateTime(timezone=True), server_default=func.now())
     resolved = Column(Boolean, default=False)
     
+    __table_args__ = (
+        Index("ix_exceptions_resolved_raised", "resolved", "raised_at"),
+    )
+    
     # Relationship
     document = relationship("Document", back_populates="exceptions")
 
 class Alert(Base):
     __tablename__ = "alerts"
     
-    id = Column(String, primary_key=True, index=True)
+    id = Column(String, primary_key=True, index=True, default=new_id)
     title = Column(String, nullable=False)
     description = Column(Text, nullable=False)
     level = Column(String, nullable=False)  # info, warning, critical
+    level_rank = Column(SmallInteger, default=_default_level_rank)  # derived from level, see ALERT_LEVEL_RANKS
     timestamp = Column(DateTime(timezone=True), server_default=func.now())
     acknowledged = Column(Boolean, default=False)
     document_id = Column(String, ForeignKey("documents.id"), nullable=True)
     
+    __table_args__ = (
+        Index("ix_alerts_ack_ts", "acknowledged", "timestamp"),
+        Index("ix_alerts_doc", "document_id"),
+    )
+    
     # Relationship
     document = relationship("Document", back_populates="alerts")
 
+# Matches the get_alerts ordering so the list can be read straight off the index
+Index("ix_alerts_ack_rank_ts", Alert.acknowledged, Alert.level_rank, Alert.timestamp.desc())
+
 # Add relationships to Document model
 Document.exceptions = relationship("Exception", back_populates="document")
 Document.alerts = relationship("Alert", back_populates="document")
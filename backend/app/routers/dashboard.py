@@ -1,17 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.database import get_db
+from fastapi import APIRouter, Depends, Request, Response
+from app.dependencies import get_document_service
 from app.services.document_service import DocumentService
+from app.services import insights_cache
 from app.schemas import DashboardInsights
 
 router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
 
 @router.get("/", response_model=DashboardInsights)
-async def get_dashboard_insights(db: Session = Depends(get_db)):
+async def get_dashboard_insights(request: Request, document_service: DocumentService = Depends(get_document_service)):
     """Get dashboard insights including KPIs, trends, and recent alerts/exceptions"""
-    try:
-        document_service = DocumentService(db)
-        insights = document_service.get_dashboard_insights()
-        return insights
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to fetch dashboard insights: {str(e)}")
+    payload = await insights_cache.get_dashboard_payload(document_service.get_dashboard_insights)
+    # no-cache: clients revalidate every poll, so a write is never hidden, but unchanged
+    # insights come back as a bodiless 304
+    headers = {"etag": payload.etag, "cache-control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None and payload.etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(content=payload.body, media_type="application/json", headers=headers)
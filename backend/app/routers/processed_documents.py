@@ -1,149 +1,231 @@
 from fastapi import APIRouter, HTTPException, Depends
-from typing import List, Dict
+from fastapi.responses import ORJSONResponse
+from typing import List, Dict, FrozenSet, Iterator, Optional
 from app.services.pdf_processor import PDFProcessor
+from app.dependencies import get_pdf_processor
 import os
-import json
+import mmap
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import ijson
+import orjson
 
 router = APIRouter(prefix="/api/processed-documents", tags=["processed-documents"])
 
-@router.get("/")
-async def get_processed_documents():
-    """Get list of processed documents with their extracted content"""
+# Endpoints here return ORJSONResponse directly: the payloads are plain JSON already, so
+# FastAPI's jsonable_encoder walk over the (potentially large) full_text is skipped
+
+# Larger read buffer than the 8 KiB default; processed files carry the full extracted text
+_READ_BUFFER_SIZE = 131072
+
+# Files above this size are memory-mapped instead of copied into a bytes object
+_MMAP_THRESHOLD = 65536
+
+# Bounded pool for parsing processed files off the event loop
+_EXEC = ThreadPoolExecutor(max_workers=8, thread_name_prefix="processed-docs")
+
+# document_id -> filename for processed JSON files, rebuilt when the directory changes
+_DOC_INDEX: Dict[str, str] = {}
+_INDEX_MTIME: float = 0.0
+# Every .json name seen by the last scan, including files without a document_id
+_INDEX_NAMES: FrozenSet[str] = frozenset()
+
+def _read_document_id(path: str) -> Optional[str]:
+    """Read only the top-level document_id of a processed file, stopping the parse as soon as it is seen"""
     try:
-        processor = PDFProcessor()
-        processed_dir = processor.processed_dir
-        
-        if not os.path.exists(processed_dir):
-            return {"documents": []}
-        
-        documents = []
-        
-        # Read all processed files
-        seen_document_ids = set()
-        seen_keys = set()  # For deduplication by title+amount+client
-        
-        for filename in os.listdir(processed_dir):
-            if filename.endswith('.json'):
-                file_path = os.path.join(processed_dir, filename)
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        
-                        # Skip if not successful
-                        if not data.get('success', False):
-                            continue
-                        
-                        # Deduplicate by document_id
-                        doc_id = data.get('document_id')
-                        if doc_id and doc_id in seen_document_ids:
-                            continue
-                        
-                        # Also deduplicate by title+amount+client
-                        extracted = data.get('extracted_data', {})
-                        title = extracted.get('title', '')
-                        amount = extracted.get('amount', 0)
-                        client = extracted.get('client', '')
-                        dedup_key = f"{title}_{amount}_{client}"
-                        
-                        if dedup_key in seen_keys:
-                            continue
-                        
-                        seen_document_ids.add(doc_id)
-                        seen_keys.add(dedup_key)
-                        documents.append(data)
-                except Exception as e:
-                    print(f"Error reading {filename}: {e}")
-                    continue
-        
-        # Sort by processing time (newest first)
-        documents.sort(key=lambda x: x.get('processing_time', ''), reverse=True)
-        
-        return {"documents": documents}
-        
+        with open(path, 'rb', buffering=_READ_BUFFER_SIZE) as f:
+            for prefix, event, value in ijson.parse(f, buf_size=_READ_BUFFER_SIZE):
+                if prefix == 'document_id':
+                    return value
+    except Exception as e:
+        print(f"Error reading document_id from {os.path.basename(path)}: {e}")
+    return None
+
+def _refresh_index(processed_dir: str, force: bool = False) -> None:
+    """Rebuild the document_id index if the processed directory has changed since the last scan"""
+    global _INDEX_MTIME, _INDEX_NAMES
+    
+    try:
+        mtime = os.stat(processed_dir).st_mtime
+    except FileNotFoundError:
+        _DOC_INDEX.clear()
+        _INDEX_MTIME = 0.0
+        _INDEX_NAMES = frozenset()
+        return
+    
+    if not force and mtime == _INDEX_MTIME:
+        return
+    
+    index: Dict[str, str] = {}
+    names = set()
+    with os.scandir(processed_dir) as it:
+        for entry in it:
+            if not entry.name.endswith('.json'):
+                continue
+            names.add(entry.name)
+            doc_id = _read_document_id(entry.path)
+            if doc_id:
+                index.setdefault(doc_id, entry.name)
+    
+    _DOC_INDEX.clear()
+    _DOC_INDEX.update(index)
+    _INDEX_MTIME = mtime
+    _INDEX_NAMES = frozenset(names)
+
+def _index_new_files(processed_dir: str) -> None:
+    """Index .json files added since the last scan and drop removed ones, reading only the new files"""
+    global _INDEX_NAMES
+    
+    try:
+        with os.scandir(processed_dir) as it:
+            names = frozenset(entry.name for entry in it if entry.name.endswith('.json'))
+    except FileNotFoundError:
+        names = frozenset()
+    
+    if names == _INDEX_NAMES:
+        return
+    
+    removed = _INDEX_NAMES - names
+    for doc_id, filename in list(_DOC_INDEX.items()):
+        if filename in removed:
+            del _DOC_INDEX[doc_id]
+    for name in names - _INDEX_NAMES:
+        doc_id = _read_document_id(os.path.join(processed_dir, name))
+        if doc_id:
+            _DOC_INDEX.setdefault(doc_id, name)
+    _INDEX_NAMES = names
+
+def _indexed_paths(processed_dir: str, document_id: str) -> Iterator[str]:
+    """Yield the indexed file for a document ID, then its file after a full rescan if the caller keeps going.
+    
+    Callers stop at the first path that still holds the document. An ID missing from the index only
+    picks up files added since the last scan (written within the directory's mtime granularity), so
+    unknown IDs don't re-read the whole directory; a stale entry triggers one full rescan.
+    """
+    _refresh_index(processed_dir)
+    if document_id not in _DOC_INDEX:
+        _index_new_files(processed_dir)
+    
+    filename = _DOC_INDEX.get(document_id)
+    if filename is None:
+        return
+    yield os.path.join(processed_dir, filename)
+    
+    # The indexed file no longer holds this document
+    _refresh_index(processed_dir, force=True)
+    filename = _DOC_INDEX.get(document_id)
+    if filename is not None:
+        yield os.path.join(processed_dir, filename)
+
+def _load_indexed_document(processed_dir: str, document_id: str) -> Optional[Dict]:
+    """Load a processed document by ID via the index"""
+    for path in _indexed_paths(processed_dir, document_id):
+        data = _parse_processed_file(path)
+        if data is not None and data.get('document_id') == document_id:
+            return data
+    return None
+
+def _parse_processed_file(path: str) -> Optional[Dict]:
+    """Read and parse one processed JSON file, returning None if it can't be read"""
+    try:
+        with open(path, 'rb', buffering=_READ_BUFFER_SIZE) as f:
+            if os.fstat(f.fileno()).st_size <= _MMAP_THRESHOLD:
+                return orjson.loads(f.read())
+            # orjson parses straight from the mapped pages, skipping the read() copy
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to get processed documents: {str(e)}")
+        print(f"Error reading {os.path.basename(path)}: {e}")
+        return None
+
+@router.get("/")
+async def get_processed_documents(processor: PDFProcessor = Depends(get_pdf_processor)):
+    """Get list of processed documents with their extracted content"""
+    processed_dir = processor.processed_dir
+    
+    if not os.path.exists(processed_dir):
+        return ORJSONResponse({"documents": []})
+    
+    documents = []
+    
+    # Read all processed files
+    seen_document_ids = set()
+    seen_keys = set()  # (title, amount, client) tuples for deduplication
+    
+    # Newest files first; the mtime comes from the directory entry, so sorting needs no parsing
+    with os.scandir(processed_dir) as it:
+        entries = [entry for entry in it if entry.name.endswith('.json')]
+    entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+    
+    # Parse files concurrently in the pool; results keep the mtime order of entries
+    loop = asyncio.get_running_loop()
+    parsed = await asyncio.gather(*[
+        loop.run_in_executor(_EXEC, _parse_processed_file, entry.path) for entry in entries
+    ])
+    
+    for data in parsed:
+        # Skip unreadable or unsuccessful results
+        if data is None or not data.get('success', False):
+            continue
+        
+        # Deduplicate by document_id
+        doc_id = data.get('document_id')
+        if doc_id and doc_id in seen_document_ids:
+            continue
+        
+        # Also deduplicate by title+amount+client
+        extracted = data.get('extracted_data', {})
+        title = extracted.get('title', '')
+        amount = extracted.get('amount', 0)
+        client = extracted.get('client', '')
+        dedup_key = (title, amount, client)
+        
+        if dedup_key in seen_keys:
+            continue
+        
+        seen_document_ids.add(doc_id)
+        seen_keys.add(dedup_key)
+        documents.append(data)
+    
+    return ORJSONResponse({"documents": documents})
 
 @router.get("/{document_id}")
-async def get_processed_document(document_id: str):
+async def get_processed_document(document_id: str, processor: PDFProcessor = Depends(get_pdf_processor)):
     """Get specific processed document by ID"""
-    try:
-        processor = PDFProcessor()
-        processed_dir = processor.processed_dir
-        
-        # Look for JSON file with this document ID
-        for filename in os.listdir(processed_dir):
-            if filename.endswith('.json'):
-                file_path = os.path.join(processed_dir, filename)
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        if data.get('document_id') == document_id:
-                            return data
-                except Exception as e:
-                    continue
-        
+    processed_dir = processor.processed_dir
+    
+    data = _load_indexed_document(processed_dir, document_id)
+    if data is None:
         raise HTTPException(status_code=404, detail="Document not found")
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to get document: {str(e)}")
+    
+    return ORJSONResponse(data)
 
 @router.get("/content/{document_id}")
-async def get_document_content(document_id: str):
+async def get_document_content(document_id: str, processor: PDFProcessor = Depends(get_pdf_processor)):
     """Get the full text content of a processed document"""
-    try:
-        processor = PDFProcessor()
-        processed_dir = processor.processed_dir
-        
-        # Look for JSON file with this document ID
-        for filename in os.listdir(processed_dir):
-            if filename.endswith('.json'):
-                file_path = os.path.join(processed_dir, filename)
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        if data.get('document_id') == document_id:
-                            return {
-                                "document_id": document_id,
-                                "full_text": data.get('full_text', ''),
-                                "extracted_data": data.get('extracted_data', {}),
-                                "processing_time": data.get('processing_time', '')
-                            }
-                except Exception as e:
-                    continue
-        
+    processed_dir = processor.processed_dir
+    
+    data = _load_indexed_document(processed_dir, document_id)
+    if data is None:
         raise HTTPException(status_code=404, detail="Document not found")
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to get document content: {str(e)}")
+    
+    return ORJSONResponse({
+        "document_id": document_id,
+        "full_text": data.get('full_text', ''),
+        "extracted_data": data.get('extracted_data', {}),
+        "processing_time": data.get('processing_time', '')
+    })
 
 @router.delete("/{document_id}")
-async def delete_processed_document(document_id: str):
+async def delete_processed_document(document_id: str, processor: PDFProcessor = Depends(get_pdf_processor)):
     """Delete a processed document by ID"""
-    try:
-        processor = PDFProcessor()
-        processed_dir = processor.processed_dir
-        
-        # Look for JSON file with this document ID
-        for filename in os.listdir(processed_dir):
-            if filename.endswith('.json'):
-                file_path = os.path.join(processed_dir, filename)
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        if data.get('document_id') == document_id:
-                            # Delete the JSON file
-                            os.remove(file_path)
-                            return {"message": "Document deleted successfully", "document_id": document_id}
-                except Exception as e:
-                    continue
-        
-        raise HTTPException(status_code=404, detail="Document not found")
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to delete document: {str(e)}")
+    processed_dir = processor.processed_dir
+    
+    # Verifying the indexed file only needs its document_id, not a full parse
+    for file_path in _indexed_paths(processed_dir, document_id):
+        if _read_document_id(file_path) == document_id:
+            os.remove(file_path)
+            _DOC_INDEX.pop(document_id, None)
+            return {"message": "Document deleted successfully", "document_id": document_id}
+    
+    raise HTTPException(status_code=404, detail="Document not found")
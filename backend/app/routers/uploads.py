@@ -3,6 +3,8 @@ from fastapi.responses import FileResponse
 from typing import List
 from sqlalchemy.orm import Session
 from app.database import get_db
+from app.dependencies import get_upload_service
+from app.services import insights_cache
 from app.services.upload_service import UploadService
 from app.schemas import UploadResponse
 import os
@@ -10,59 +12,45 @@ import os
 router = APIRouter(prefix="/api/uploads", tags=["uploads"])
 
 @router.post("/", response_model=UploadResponse)
-async def upload_files(files: List[UploadFile] = File(...)):
+async def upload_files(
+    files: List[UploadFile] = File(...),
+    upload_service: UploadService = Depends(get_upload_service)
+):
     """Upload multiple files"""
-    try:
-        upload_service = UploadService()
-        response = await upload_service.upload_files(files)
-        return response
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to upload files: {str(e)}")
+    response = await upload_service.upload_files(files)
+    return response
 
 @router.get("/{filename}")
-async def get_file(filename: str):
+async def get_file(filename: str, upload_service: UploadService = Depends(get_upload_service)):
     """Get an uploaded file"""
-    try:
-        upload_service = UploadService()
-        file_path = upload_service.get_file_path(filename)
-        
-        if not os.path.exists(file_path):
-            raise HTTPException(status_code=404, detail="File not found")
-        
-        return FileResponse(file_path)
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to retrieve file: {str(e)}")
+    file_path = upload_service.get_file_path(filename)
+    
+    if not os.path.exists(file_path):
+        raise HTTPException(status_code=404, detail="File not found")
+    
+    return FileResponse(file_path)
 
 @router.delete("/{filename}")
-async def delete_file(filename: str):
+async def delete_file(filename: str, upload_service: UploadService = Depends(get_upload_service)):
     """Delete an uploaded file"""
-    try:
-        upload_service = UploadService()
-        success = upload_service.delete_file(filename)
-        
-        if not success:
-            raise HTTPException(status_code=404, detail="File not found")
-        
-        return {"message": "File deleted successfully"}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to delete file: {str(e)}")
+    success = upload_service.delete_file(filename)
+    
+    if not success:
+        raise HTTPException(status_code=404, detail="File not found")
+    
+    return {"message": "File deleted successfully"}
 
 @router.post("/process/{filename}")
-async def process_pdf(filename: str, db: Session = Depends(get_db)):
+async def process_pdf(
+    filename: str,
+    db: Session = Depends(get_db),
+    upload_service: UploadService = Depends(get_upload_service)
+):
     """Process an uploaded PDF file and extract data"""
-    try:
-        upload_service = UploadService()
-        result = await upload_service.process_uploaded_pdf(filename, db)
-        
-        if not result.get("success", False):
-            raise HTTPException(status_code=400, detail=result.get("error", "Processing failed"))
-        
-        return result
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to process PDF: {str(e)}")
+    result = await upload_service.process_uploaded_pdf(filename, db)
+    insights_cache.invalidate()
+    
+    if not result.get("success", False):
+        raise HTTPException(status_code=400, detail=result.get("error", "Processing failed"))
+    
+    return result
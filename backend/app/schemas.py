@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from typing import Optional, List, Type, TypeVar
 from datetime import datetime
 
 # Document schemas
@@ -42,8 +42,7 @@ class Document(DocumentBase):
     file_path: Optional[str] = None
     processed: bool = False
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 # Exception schemas
 class ExceptionBase(BaseModel):
@@ -66,8 +65,7 @@ class Exception(ExceptionBase):
     raised_at: datetime
     resolved: bool = False
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 # Alert schemas
 class AlertBase(BaseModel):
@@ -90,8 +88,10 @@ class Alert(AlertBase):
     timestamp: datetime
     acknowledged: bool = False
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+# Response schemas are frozen: they are only built, never mutated, and cached
+# dashboard insights are shared between requests
 
 # Dashboard schemas
 class KPIMetric(BaseModel):
@@ -99,16 +99,22 @@ class KPIMetric(BaseModel):
     value: str
     delta: str
     helper: str
+    
+    model_config = ConfigDict(frozen=True)
 
 class UtilizationTrend(BaseModel):
     month: str
     client: int
     vendor: int
+    
+    model_config = ConfigDict(frozen=True)
 
 class CategorySplit(BaseModel):
     name: str
     value: int
     fill: str
+    
+    model_config = ConfigDict(frozen=True)
 
 class DashboardInsights(BaseModel):
     kpis: List[KPIMetric]
@@ -116,6 +122,8 @@ class DashboardInsights(BaseModel):
     categorySplit: List[CategorySplit]
     alerts: List[Alert]
     exceptions: List[Exception]
+    
+    model_config = ConfigDict(frozen=True)
 
 # Chat schemas
 class ChatMessage(BaseModel):
@@ -128,6 +136,8 @@ class ChatRequest(BaseModel):
 
 class ChatResponse(BaseModel):
     reply: str
+    
+    model_config = ConfigDict(frozen=True)
 
 # Upload schemas
 class UploadedFile(BaseModel):
@@ -136,12 +146,29 @@ class UploadedFile(BaseModel):
     type: str
     status: str
     location: str
+    
+    model_config = ConfigDict(frozen=True)
 
 class UploadResponse(BaseModel):
     uploads: List[UploadedFile]
+    
+    model_config = ConfigDict(frozen=True)
 
 # Document detail response
 class DocumentDetailResponse(BaseModel):
     document: Document
     related_exceptions: List[Exception]
     related_alerts: List[Alert]
+    
+    model_config = ConfigDict(frozen=True)
+
+# Reusable adapters for serializing responses without rebuilding validators per request
+DocumentListAdapter = TypeAdapter(List[Document])
+DashboardInsightsAdapter = TypeAdapter(DashboardInsights)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+def construct_from_rows(model: Type[ModelT], rows) -> List[ModelT]:
+    """Build response models from trusted ORM rows without running validation"""
+    fields = tuple(model.model_fields)
+    return [model.model_construct(**{name: getattr(row, name) for name in fields}) for row in rows]
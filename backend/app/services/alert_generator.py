@@ -10,9 +10,17 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func, and_, or_
 from app.models import Document, Alert
 from app.services.document_linking_service import DocumentLinkingService
+from app.services import insights_cache
 from typing import List, Optional, Dict, Tuple
 from datetime import datetime, timedelta
-import uuid
+from collections import defaultdict
+import secrets
+
+# Random 32-char hex alert ids straight from the OS RNG, without building UUID objects
+_token = secrets.token_hex
+
+# Thousands-separated, two-decimal amount formatting used in alert descriptions
+_fmt_amount = "{:,.2f}".format
 
 
 class AlertGenerator:
@@ -23,79 +31,143 @@ class AlertGenerator:
     PO_UTILIZATION_CRITICAL_THRESHOLD = 0.95  # 95% utilization triggers critical
     CONTRACT_EXPIRY_WARNING_DAYS = 30  # Alert 30 days before expiration
     
+    # Description templates for the most frequently generated alerts
+    _DESC_PO_NEARLY_CONSUMED = "PO %s is %.1f%% utilized (%d invoices totaling %s %s of %s %s). Only %s %s remaining."
+    _DESC_PO_APPROACHING = "PO %s is %.1f%% utilized (%d invoices totaling %s %s of %s %s). %s %s remaining."
+    _DESC_CONTRACT_CONTEXT = " This contract governs %d PO(s) worth %s %s with %d linked invoice(s)."
+    _DESC_CONTRACT_EXPIRED = "Service Agreement %s expired on %s.%s Please renew or terminate."
+    _DESC_CONTRACT_EXPIRING = "Service Agreement %s will expire in %d days (%s).%s Please review renewal options."
+    
     def __init__(self, db: Session):
         self.db = db
         self.linking_service = DocumentLinkingService(db)
+        # Timestamp shared by every alert row built in the current batch
+        self._now = datetime.utcnow()
+        # In-memory lookups populated only while refresh_all_alerts runs
+        self._by_id: Optional[Dict[str, Document]] = None
+        self._invoices_by_po: Optional[Dict[str, List[Document]]] = None
+        self._invoice_po_links: Optional[Dict[str, Optional[Document]]] = None
+        # PO consumption by PO id; entries are dropped whenever an invoice link changes
+        self._consumption_cache: Dict[str, Dict[str, float]] = {}
+        # Per-category alert handlers
+        self._handlers = {
+            "Client Invoice": self._handle_invoice,
+            "Vendor Invoice": self._handle_invoice,
+            "Client PO": self._handle_po,
+            "Vendor PO": self._handle_po,
+            "Service Agreement": self._handle_contract,
+        }
     
-    def generate_alerts_for_document(self, document: Document) -> List[Alert]:
+    def generate_alerts_for_document(self, document: Document) -> List[Dict]:
         """
         Generate alerts for a newly processed document.
-        Returns a list of created alerts.
+        Returns the inserted alert rows as dicts.
+        Link updates and alerts are only flushed; the caller commits.
         """
+        self._now = datetime.utcnow()
+        self._consumption_cache.clear()
+        alerts = self._collect_alerts_for_document(document)
+        if alerts:
+            self.db.bulk_insert_mappings(Alert, alerts)
+        return alerts
+    
+    def _new_alert(self, title: str, description: str, level: str, document_id: Optional[str]) -> Dict:
+        """Build an alert row for bulk insertion"""
+        return {
+            "id": _token(16),
+            "title": title,
+            "description": description,
+            "level": level,
+            "document_id": document_id,
+            "timestamp": self._now,
+            "acknowledged": False,
+        }
+    
+    def _collect_alerts_for_document(self, document: Document) -> List[Dict]:
+        """Build (but don't insert) the alert rows for a single document"""
+        # Generate alerts based on document type
+        handler = self._handlers.get(document.category)
+        return handler(document) if handler else []
+    
+    def _handle_invoice(self, document: Document) -> List[Dict]:
+        """Link an invoice to its PO and check it against that PO"""
         alerts = []
         
-        # Generate alerts based on document type
-        if document.category in ["Client Invoice", "Vendor Invoice"]:
-            # Link invoice to PO using enhanced linking service
+        # Link invoice to PO using enhanced linking service (batch-resolved during a refresh)
+        if self._invoice_po_links is not None:
+            linked_po = self._invoice_po_links.get(document.id)
+        else:
             linked_po = self.linking_service.link_invoice_to_po(document)
-            if linked_po:
-                document.linked_to = linked_po.id
-                self.db.commit()
-            
-            # Check invoice-PO matching and validation
-            invoice_alerts = self._check_invoice_po_match(document, linked_po)
-            alerts.extend(invoice_alerts)
-            
-            # Check PO utilization if invoice is linked to a PO
-            if linked_po:
-                utilization_alerts = self._check_po_utilization(linked_po.id)
-                alerts.extend(utilization_alerts)
-                
-                # Check contract validity for linked PO
-                contract_alerts = self._check_contract_validity_for_po(linked_po)
-                alerts.extend(contract_alerts)
-        
-        elif document.category in ["Client PO", "Vendor PO"]:
-            # Link PO to contract
-            linked_contract = self.linking_service.link_po_to_contract(document)
-            if linked_contract:
-                if not document.linked_to:  # Only set if not already linked
-                    document.linked_to = linked_contract.id
-                    self.db.commit()
-            
-            # Check PO utilization for this PO
-            utilization_alerts = self._check_po_utilization(document.id)
+        if linked_po:
+            self._set_invoice_link(document, linked_po.id)
+            # Flush (not commit) so later queries in this batch see the link
+            self.db.flush()
+        
+        # Check invoice-PO matching and validation
+        invoice_alerts = self._check_invoice_po_match(document, linked_po)
+        alerts.extend(invoice_alerts)
+        
+        # Check PO utilization if invoice is linked to a PO
+        if linked_po:
+            utilization_alerts = self._check_po_utilization(linked_po)
             alerts.extend(utilization_alerts)
             
-            # Check contract validity
-            if linked_contract:
-                contract_alerts = self._check_contract_validity_for_po(document)
-                alerts.extend(contract_alerts)
-        
-        elif document.category in ["Service Agreement"]:
-            # Link contract to related POs
-            linked_pos = self.linking_service.link_contract_to_po(document)
-            
-            # Check contract expiration
-            expiry_alerts = self._check_contract_expiration(document)
-            alerts.extend(expiry_alerts)
-            
-            # Check if linked POs/invoices are within contract period
-            for po in linked_pos:
-                validity_alerts = self._check_contract_validity_for_po(po, document)
-                alerts.extend(validity_alerts)
+            # Check contract validity for linked PO
+            contract_alerts = self._check_contract_validity_for_po(linked_po)
+            alerts.extend(contract_alerts)
+        
+        return alerts
+    
+    def _handle_po(self, document: Document) -> List[Dict]:
+        """Link a PO to its contract and check utilization and contract validity"""
+        alerts = []
+        
+        # Link PO to contract
+        linked_contract = self.linking_service.link_po_to_contract(document)
+        if linked_contract:
+            if not document.linked_to:  # Only set if not already linked
+                document.linked_to = linked_contract.id
+                self.db.flush()
+        
+        # Check PO utilization for this PO
+        utilization_alerts = self._check_po_utilization(document)
+        alerts.extend(utilization_alerts)
+        
+        # Check contract validity against the contract found above
+        if linked_contract:
+            contract_alerts = self._check_contract_validity_for_po(document, linked_contract)
+            alerts.extend(contract_alerts)
+        
+        return alerts
+    
+    def _handle_contract(self, document: Document) -> List[Dict]:
+        """Check a contract's expiration and the validity of its POs"""
+        alerts = []
+        
+        # Link contract to related POs
+        linked_pos = self.linking_service.link_contract_to_po(document)
+        
+        # Check contract expiration
+        expiry_alerts = self._check_contract_expiration(document)
+        alerts.extend(expiry_alerts)
+        
+        # Check if linked POs/invoices are within contract period
+        for po in linked_pos:
+            validity_alerts = self._check_contract_validity_for_po(po, document)
+            alerts.extend(validity_alerts)
         
         return alerts
     
-    def _check_contract_validity_for_po(self, po: Document, contract: Document = None) -> List[Alert]:
+    def _check_contract_validity_for_po(self, po: Document, contract: Document = None) -> List[Dict]:
         """
         Check if a PO and its linked invoices fall within contract validity period.
         Returns alerts if documents are outside contract period.
         """
         alerts = []
         
-        # Get contract (either provided or linked to PO)
-        if not contract:
+        # Get contract (either provided or linked to PO); the lookup is only needed
+        # when the caller has not already resolved it
+        if contract is None:
             contract = self.linking_service.link_po_to_contract(po)
         
         if not contract or not contract.due_date:
@@ -104,38 +176,28 @@ class AlertGenerator:
         # Check PO validity
         validity = self.linking_service.check_contract_validity_for_document(po, contract)
         if not validity.get("valid"):
-            alert = Alert(
-                id=str(uuid.uuid4()),
+            alerts.append(self._new_alert(
                 title="Purchase Order Outside Contract Period",
                 description=f"PO {po.title} ({po.created_at.date()}) is outside the validity period of contract {contract.title} (valid until {contract.due_date.date()}). {validity.get('reason', '')}",
                 level="warning",
-                document_id=po.id,
-                timestamp=datetime.utcnow(),
-                acknowledged=False
-            )
-            self.db.add(alert)
-            alerts.append(alert)
-        
-        # Check linked invoices validity
-        linked_invoices = self.linking_service.get_linked_invoices(po)
-        for invoice in linked_invoices:
-            invoice_validity = self.linking_service.check_contract_validity_for_document(invoice, contract)
-            if not invoice_validity.get("valid"):
-                alert = Alert(
-                    id=str(uuid.uuid4()),
-                    title="Invoice Outside Contract Period",
-                    description=f"Invoice {invoice.title} ({invoice.created_at.date()}) is outside the validity period of contract {contract.title} (valid until {contract.due_date.date()}). {invoice_validity.get('reason', '')}",
-                    level="warning",
-                    document_id=invoice.id,
-                    timestamp=datetime.utcnow(),
-                    acknowledged=False
-                )
-                self.db.add(alert)
-                alerts.append(alert)
+                document_id=po.id
+            ))
+        
+        # Check linked invoices validity; only invoices outside the period come back
+        invoices = self._get_invoices_outside_contract(po, contract)
+        invoice_validities = self.linking_service.check_contracts_validity_bulk(invoices, contract)
+        for invoice in invoices:
+            invoice_validity = invoice_validities[invoice.id]
+            alerts.append(self._new_alert(
+                title="Invoice Outside Contract Period",
+                description=f"Invoice {invoice.title} ({invoice.created_at.date()}) is outside the validity period of contract {contract.title} (valid until {contract.due_date.date()}). {invoice_validity.get('reason', '')}",
+                level="warning",
+                document_id=invoice.id
+            ))
         
         return alerts
     
-    def _check_invoice_po_match(self, invoice: Document, linked_po: Optional[Document] = None) -> List[Alert]:
+    def _check_invoice_po_match(self, invoice: Document, linked_po: Optional[Document] = None) -> List[Dict]:
         """
         Check if an invoice matches its linked PO using enhanced validation.
         Generates alerts for:
@@ -149,105 +211,91 @@ class AlertGenerator:
         
         # Use provided linked_po or get from invoice.linked_to
         if not linked_po and invoice.linked_to:
-            linked_po = self.db.query(Document).filter(Document.id == invoice.linked_to).first()
+            linked_po = self._get_document(invoice.linked_to)
         
         if not linked_po:
             # Invoice has no linked PO - create warning alert
-            alert = Alert(
-                id=str(uuid.uuid4()),
+            alerts.append(self._new_alert(
                 title="Invoice Not Linked to Purchase Order",
                 description=f"Invoice {invoice.title} ({invoice.amount:,.2f} {invoice.currency}) could not be matched to a Purchase Order. Please review and link manually.",
                 level="warning",
-                document_id=invoice.id,
-                timestamp=datetime.utcnow(),
-                acknowledged=False
-            )
-            self.db.add(alert)
-            alerts.append(alert)
+                document_id=invoice.id
+            ))
             return alerts
         
         # Use enhanced validation service
-        validation = self.linking_service.validate_invoice_against_po(invoice, linked_po)
+        validation = self.linking_service.validate_invoice_against_po(
+            invoice, linked_po, consumption=self._get_po_consumption(linked_po)
+        )
         
         # Process critical issues
         for issue in validation.get("issues", []):
-            alert = Alert(
-                id=str(uuid.uuid4()),
+            alerts.append(self._new_alert(
                 title=issue["type"].replace("_", " ").title(),
                 description=f"Invoice {invoice.title}: {issue['message']}. PO: {linked_po.title} (Total: {linked_po.amount:,.2f} {linked_po.currency}).",
                 level="critical",
-                document_id=invoice.id,
-                timestamp=datetime.utcnow(),
-                acknowledged=False
-            )
-            self.db.add(alert)
-            alerts.append(alert)
+                document_id=invoice.id
+            ))
         
         # Process warnings
         for warning in validation.get("warnings", []):
-            alert = Alert(
-                id=str(uuid.uuid4()),
+            alerts.append(self._new_alert(
                 title=warning["type"].replace("_", " ").title(),
                 description=f"Invoice {invoice.title}: {warning['message']}. PO: {linked_po.title}.",
                 level="warning",
-                document_id=invoice.id,
-                timestamp=datetime.utcnow(),
-                acknowledged=False
-            )
-            self.db.add(alert)
-            alerts.append(alert)
+                document_id=invoice.id
+            ))
         
         return alerts
     
-    def _check_po_utilization(self, po_id: str) -> List[Alert]:
+    def _check_po_utilization(self, po: Document) -> List[Dict]:
         """
         Check if a PO is close to being fully consumed using enhanced consumption calculation.
+        Takes the already-loaded PO so no lookup is needed.
         Generates alerts when utilization exceeds thresholds.
         """
         alerts = []
         
-        po = self.db.query(Document).filter(Document.id == po_id).first()
-        if not po or po.category not in ["Client PO", "Vendor PO"]:
+        if po.category not in ["Client PO", "Vendor PO"]:
             return alerts
         
         # Use enhanced consumption calculation
-        consumption = self.linking_service.calculate_po_consumption(po)
+        consumption = self._get_po_consumption(po)
         utilization_ratio = consumption["utilization_percentage"] / 100
         remaining_balance = consumption["remaining_balance"]
         total_invoiced = consumption["total_invoiced"]
         linked_invoice_count = consumption["linked_invoice_count"]
         
+        if utilization_ratio < self.PO_UTILIZATION_WARNING_THRESHOLD:
+            return alerts
+        
+        description_args = (
+            po.title, consumption["utilization_percentage"], linked_invoice_count,
+            _fmt_amount(total_invoiced), po.currency, _fmt_amount(po.amount), po.currency,
+            _fmt_amount(remaining_balance), po.currency
+        )
+        
         # Check thresholds
         if utilization_ratio >= self.PO_UTILIZATION_CRITICAL_THRESHOLD:
             # Critical: PO is almost fully consumed
-            alert = Alert(
-                id=str(uuid.uuid4()),
+            alerts.append(self._new_alert(
                 title="Purchase Order Nearly Fully Consumed",
-                description=f"PO {po.title} is {consumption['utilization_percentage']:.1f}% utilized ({linked_invoice_count} invoices totaling {total_invoiced:,.2f} {po.currency} of {po.amount:,.2f} {po.currency}). Only {remaining_balance:,.2f} {po.currency} remaining.",
+                description=self._DESC_PO_NEARLY_CONSUMED % description_args,
                 level="critical",
-                document_id=po_id,
-                timestamp=datetime.utcnow(),
-                acknowledged=False
-            )
-            self.db.add(alert)
-            alerts.append(alert)
-        elif utilization_ratio >= self.PO_UTILIZATION_WARNING_THRESHOLD:
+                document_id=po.id
+            ))
+        else:
             # Warning: PO is getting close to fully consumed
-            alert = Alert(
-                id=str(uuid.uuid4()),
+            alerts.append(self._new_alert(
                 title="Purchase Order Approaching Full Utilization",
-                description=f"PO {po.title} is {consumption['utilization_percentage']:.1f}% utilized ({linked_invoice_count} invoices totaling {total_invoiced:,.2f} {po.currency} of {po.amount:,.2f} {po.currency}). {remaining_balance:,.2f} {po.currency} remaining.",
+                description=self._DESC_PO_APPROACHING % description_args,
                 level="warning",
-                document_id=po_id,
-                timestamp=datetime.utcnow(),
-                acknowledged=False
-            )
-            self.db.add(alert)
-            alerts.append(alert)
+                document_id=po.id
+            ))
         
         return alerts
     
-    def _check_contract_expiration(self, contract: Document) -> List[Alert]:
+    def _check_contract_expiration(self, contract: Document) -> List[Dict]:
         """
         Check if a contract/service agreement is close to expiration.
         Also checks if linked POs/invoices will be affected.
@@ -259,68 +307,90 @@ class AlertGenerator:
             return alerts
         
         # Calculate days until expiration
-        days_until_expiry = (contract.due_date - datetime.utcnow()).days
+        days_until_expiry = (contract.due_date - self._now).days
         
-        # Get linked POs to include in alert context
-        linked_pos = self.linking_service.get_linked_pos_for_contract(contract)
-        linked_po_count = len(linked_pos)
+        if days_until_expiry > self.CONTRACT_EXPIRY_WARNING_DAYS:
+            return alerts
         
-        # Calculate total PO value and invoice count
-        total_po_value = sum(po.amount for po in linked_pos)
-        total_invoice_count = 0
-        for po in linked_pos:
-            invoices = self.linking_service.get_linked_invoices(po)
-            total_invoice_count += len(invoices)
+        # Linked PO count, total PO value and invoice count for the alert context
+        linked_po_count, total_po_value, total_invoice_count = self.linking_service.contract_rollup(contract)
+        context = ""
+        if linked_po_count > 0:
+            context = self._DESC_CONTRACT_CONTEXT % (
+                linked_po_count, _fmt_amount(total_po_value), contract.currency, total_invoice_count
+            )
+        due_date = contract.due_date.date().isoformat()
         
         if days_until_expiry < 0:
             # Contract has expired
-            context = ""
-            if linked_po_count > 0:
-                context = f" This contract governs {linked_po_count} PO(s) worth {total_po_value:,.2f} {contract.currency} with {total_invoice_count} linked invoice(s)."
-            
-            alert = Alert(
-                id=str(uuid.uuid4()),
+            alerts.append(self._new_alert(
                 title="Contract Has Expired",
-                description=f"Service Agreement {contract.title} expired on {contract.due_date.strftime('%Y-%m-%d')}.{context} Please renew or terminate.",
+                description=self._DESC_CONTRACT_EXPIRED % (contract.title, due_date, context),
                 level="critical",
-                document_id=contract.id,
-                timestamp=datetime.utcnow(),
-                acknowledged=False
-            )
-            self.db.add(alert)
-            alerts.append(alert)
-        elif days_until_expiry <= self.CONTRACT_EXPIRY_WARNING_DAYS:
+                document_id=contract.id
+            ))
+        else:
             # Contract is expiring soon
-            context = ""
-            if linked_po_count > 0:
-                context = f" This contract governs {linked_po_count} PO(s) worth {total_po_value:,.2f} {contract.currency} with {total_invoice_count} linked invoice(s)."
-            
-            alert = Alert(
-                id=str(uuid.uuid4()),
+            alerts.append(self._new_alert(
                 title="Contract Expiring Soon",
-                description=f"Service Agreement {contract.title} will expire in {days_until_expiry} days ({contract.due_date.strftime('%Y-%m-%d')}).{context} Please review renewal options.",
+                description=self._DESC_CONTRACT_EXPIRING % (contract.title, days_until_expiry, due_date, context),
                 level="warning",
-                document_id=contract.id,
-                timestamp=datetime.utcnow(),
-                acknowledged=False
-            )
-            self.db.add(alert)
-            alerts.append(alert)
+                document_id=contract.id
+            ))
         
         return alerts
     
+    def _get_document(self, document_id: str) -> Optional[Document]:
+        """Look up a document, from the refresh index when one is loaded"""
+        if self._by_id is not None:
+            return self._by_id.get(document_id)
+        # Session.get answers from the identity map when the row is already loaded
+        return self.db.get(Document, document_id)
+    
+    def _get_invoices_outside_contract(self, po: Document, contract: Document) -> list:
+        """Invoices linked to a PO that fall outside the contract period, from the refresh index when one is loaded"""
+        start, end = contract.created_at, contract.due_date
+        if self._invoices_by_po is not None:
+            return [
+                invoice for invoice in self._invoices_by_po.get(po.id, [])
+                if invoice.created_at < start or invoice.created_at > end
+            ]
+        return self.linking_service.find_invoices_outside_range(po.id, start, end)
+    
+    def _get_po_consumption(self, po: Document) -> Dict[str, float]:
+        """PO consumption, computed once per PO until one of its invoice links changes"""
+        consumption = self._consumption_cache.get(po.id)
+        if consumption is None:
+            if self._invoices_by_po is not None:
+                consumption = self.linking_service.calculate_po_consumption(po, self._invoices_by_po.get(po.id, []))
+            else:
+                # Outside a refresh, aggregate in SQL rather than loading the PO's invoices
+                consumption = self.linking_service.calculate_po_consumption(po)
+            self._consumption_cache[po.id] = consumption
+        return consumption
+    
+    def _set_invoice_link(self, invoice: Document, po_id: str):
+        """Point an invoice at a PO, keeping the refresh index and consumption cache in sync"""
+        if invoice.linked_to != po_id:
+            if self._invoices_by_po is not None:
+                if invoice.linked_to in self._invoices_by_po:
+                    self._invoices_by_po[invoice.linked_to].remove(invoice)
+                self._invoices_by_po[po_id].append(invoice)
+            self._consumption_cache.pop(invoice.linked_to, None)
+            self._consumption_cache.pop(po_id, None)
+        invoice.linked_to = po_id
+    
     def _calculate_po_utilization(self, po_id: str) -> float:
         """
         Calculate total amount of invoices linked to a PO.
         Returns the sum of all invoice amounts.
         (Deprecated - use DocumentLinkingService.calculate_po_consumption instead)
         """
-        po = self.db.query(Document).filter(Document.id == po_id).first()
+        po = self._get_document(po_id)
         if not po:
             return 0.0
         
-        consumption = self.linking_service.calculate_po_consumption(po)
-        return consumption["total_invoiced"]
+        return self._get_po_consumption(po)["total_invoiced"]
     
     def refresh_all_alerts(self) -> int:
         """
@@ -328,17 +398,43 @@ class AlertGenerator:
         Useful for periodic updates or after bulk imports.
         Returns the number of alerts generated.
         """
+        self._now = datetime.utcnow()
+        self._consumption_cache.clear()
+        # Contract and PO lookups repeat across documents; the refresh never changes
+        # the fields they match on, so memoise them for this run
+        self.linking_service.batch_cache = {}
+        
         # Delete existing unacknowledged alerts
         self.db.query(Alert).filter(Alert.acknowledged == False).delete()
         
-        # Get all documents
+        # Get all documents and index them so per-document checks don't query again
         documents = self.db.query(Document).all()
-        
-        total_alerts = 0
+        self._by_id = {document.id: document for document in documents}
+        self._invoices_by_po = defaultdict(list)
         for document in documents:
-            alerts = self.generate_alerts_for_document(document)
-            total_alerts += len(alerts)
+            if document.linked_to and document.category in ["Client Invoice", "Vendor Invoice"]:
+                self._invoices_by_po[document.linked_to].append(document)
+        # PO lookups only read PO fields the refresh never changes, so every
+        # invoice can be resolved up front from an in-memory index of the POs
+        po_index = self.linking_service.build_po_index(documents)
+        self._invoice_po_links = self.linking_service.link_invoices_to_pos(documents, po_index)
+        
+        # Collect rows for every document, then insert them in one batch
+        all_alerts = []
+        try:
+            for document in documents:
+                all_alerts.extend(self._collect_alerts_for_document(document))
+        finally:
+            self._by_id = None
+            self._invoices_by_po = None
+            self._invoice_po_links = None
+            self._consumption_cache.clear()
+            self.linking_service.batch_cache = None
         
+        if all_alerts:
+            self.db.bulk_insert_mappings(Alert, all_alerts)
         self.db.commit()
-        return total_alerts
+        # Refreshes run outside the API routes (jobs, scripts), so drop cached insights here
+        insights_cache.invalidate()
+        return len(all_alerts)
 
@@ -1,19 +1,21 @@
 from sqlalchemy.orm import Session
-from app.models import Alert
+from app.models import Alert, alert_level_rank
 from app.schemas import AlertCreate, AlertUpdate
-from typing import List, Optional
-import uuid
-from sqlalchemy import case
+from typing import Any, Dict, List, Optional
+
+# Columns of the Alert response schema, in schema field order
+ALERT_RESPONSE_COLUMNS = (
+    Alert.title, Alert.description, Alert.level, Alert.document_id,
+    Alert.id, Alert.timestamp, Alert.acknowledged
+)
+ALERT_RESPONSE_FIELDS = tuple(column.key for column in ALERT_RESPONSE_COLUMNS)
 
 class AlertService:
     def __init__(self, db: Session):
         self.db = db
     
     def create_alert(self, alert: AlertCreate) -> Alert:
-        db_alert = Alert(
-            id=str(uuid.uuid4()),
-            **alert.dict()
-        )
+        db_alert = Alert(**alert.model_dump())
         self.db.add(db_alert)
         self.db.commit()
         self.db.refresh(db_alert)
@@ -23,21 +25,23 @@ class AlertService:
         return self.db.query(Alert).filter(Alert.id == alert_id).first()
     
     def get_alerts(self, skip: int = 0, limit: int = 100, acknowledged: Optional[bool] = None) -> List[Alert]:
-        query = self.db.query(Alert)
+        return self._ordered_alerts_query(self.db.query(Alert), acknowledged).offset(skip).limit(limit).all()
+    
+    def get_alerts_as_dicts(self, skip: int = 0, limit: int = 100, acknowledged: Optional[bool] = None) -> List[Dict[str, Any]]:
+        """Same as get_alerts, but selects only the response columns and returns plain dicts"""
+        query = self.db.query(Alert).with_entities(*ALERT_RESPONSE_COLUMNS)
+        rows = self._ordered_alerts_query(query, acknowledged).offset(skip).limit(limit).all()
+        return [dict(zip(ALERT_RESPONSE_FIELDS, row)) for row in rows]
+    
+    def _ordered_alerts_query(self, query, acknowledged: Optional[bool]):
         if acknowledged is not None:
             query = query.filter(Alert.acknowledged == acknowledged)
-        # Order by: critical first, then warning, then info; unacknowledged first; newest first
-        level_order = case(
-            (Alert.level == "critical", 1),
-            (Alert.level == "warning", 2),
-            (Alert.level == "info", 3),
-            else_=4
-        )
+        # Order by: unacknowledged first; critical, then warning, then info; newest first
         return query.order_by(
             Alert.acknowledged.asc(),  # Unacknowledged first
-            level_order.asc(),  # Critical first
+            Alert.level_rank.asc(),  # Critical first
             Alert.timestamp.desc()  # Newest first
-        ).offset(skip).limit(limit).all()
+        )
     
     def get_alerts_by_document(self, document_id: str) -> List[Alert]:
         return self.db.query(Alert).filter(Alert.document_id == document_id).all()
@@ -47,9 +51,11 @@ class AlertService:
         if not db_alert:
             return None
         
-        update_data = alert.dict(exclude_unset=True)
+        update_data = alert.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(db_alert, field, value)
+        if "level" in update_data:
+            db_alert.level_rank = alert_level_rank(db_alert.level)
         
         self.db.commit()
         self.db.refresh(db_alert)
@@ -3,36 +3,51 @@ from app.config import settings
 from app.schemas import ChatRequest, ChatResponse, ChatMessage
 from typing import List
 import json
+import re
+
+# Rule-based replies, checked in priority order: (keywords, reply)
+_TOPICS = (
+    (("po", "purchase order"), "Purchase orders are tracked with cap, utilization, vendor, and expiry metadata. You can review PO balances on the dashboard or open the document detail page for more context."),
+    (("invoice",), "Invoices are matched against their linked PO. Validation ensures amounts stay within the PO cap and alerts trigger if mismatches appear."),
+    (("agreement", "contract"), "Service agreements store vendor relationships, expiry dates, and linked PO versions. The system raises alerts 30 days before expiration."),
+    (("alert", "notification"), "Alerts fire when PO utilization crosses thresholds, invoices fail validation, or agreements near expiration. Manage rules in the Alerts view."),
+    (("chatbot", "assistant"), "I'm the DMS assistant. Ask about PO balances, upcoming expiries, or document summaries and I'll point you to the right dashboard modules."),
+)
+_TOPIC_REPLIES = tuple(reply for _, reply in _TOPICS)
+_FALLBACK_REPLY = "I can help you with purchase orders, invoices, service agreements, and alerts. What would you like to know about?"
+
+# One lookahead per topic, tried in order from the start of the message, so the
+# first topic with a keyword anywhere in the message wins; lastindex names it
+_TOPIC_PATTERN = re.compile(
+    "|".join(
+        "(?=.*?(%s))" % "|".join(re.escape(keyword) for keyword in keywords)
+        for keywords, _ in _TOPICS
+    ),
+    re.IGNORECASE | re.DOTALL
+)
 
 class ChatService:
     def __init__(self):
-        if settings.openai_api_key:
-            openai.api_key = settings.openai_api_key
+        # Created once and reused, so the client's HTTP connection pool persists across requests.
+        # No retries and a short timeout: on failure we fall back to the rule-based reply instead.
+        self.client = openai.AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            max_retries=0,
+            timeout=10.0
+        ) if settings.openai_api_key else None
     
     def process_message(self, request: ChatRequest) -> ChatResponse:
         # Simple rule-based responses for demo purposes
         # In production, you'd use OpenAI API or another LLM
         
-        user_message = request.message.lower()
-        
-        if any(keyword in user_message for keyword in ["po", "purchase order"]):
-            reply = "Purchase orders are tracked with cap, utilization, vendor, and expiry metadata. You can review PO balances on the dashboard or open the document detail page for more context."
-        elif "invoice" in user_message:
-            reply = "Invoices are matched against their linked PO. Validation ensures amounts stay within the PO cap and alerts trigger if mismatches appear."
-        elif any(keyword in user_message for keyword in ["agreement", "contract"]):
-            reply = "Service agreements store vendor relationships, expiry dates, and linked PO versions. The system raises alerts 30 days before expiration."
-        elif any(keyword in user_message for keyword in ["alert", "notification"]):
-            reply = "Alerts fire when PO utilization crosses thresholds, invoices fail validation, or agreements near expiration. Manage rules in the Alerts view."
-        elif any(keyword in user_message for keyword in ["chatbot", "assistant"]):
-            reply = "I'm the DMS assistant. Ask about PO balances, upcoming expiries, or document summaries and I'll point you to the right dashboard modules."
-        else:
-            reply = "I can help you with purchase orders, invoices, service agreements, and alerts. What would you like to know about?"
+        match = _TOPIC_PATTERN.match(request.message)
+        reply = _TOPIC_REPLIES[match.lastindex - 1] if match else _FALLBACK_REPLY
         
         return ChatResponse(reply=reply)
     
-    def process_message_with_openai(self, request: ChatRequest) -> ChatResponse:
+    async def process_message_with_openai(self, request: ChatRequest) -> ChatResponse:
         """Process message using OpenAI API (requires API key)"""
-        if not settings.openai_api_key:
+        if not self.client:
             return self.process_message(request)
         
         try:
@@ -59,7 +74,7 @@ class ChatService:
             })
             
             # Call OpenAI API
-            response = openai.ChatCompletion.create(
+            response = await self.client.chat.completions.create(
                 model="gpt-3.5-turbo",
                 messages=messages,
                 max_tokens=500,
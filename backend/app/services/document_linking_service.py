@@ -5,19 +5,86 @@ Provides sophisticated linking between:
 - Contracts/Service Agreements → Purchase Orders
 - Supports multiple linking strategies for better accuracy
 """
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy import and_, or_, func, case
 from app.models import Document
-from typing import List, Optional, Tuple, Dict
+from typing import Iterable, List, Optional, Tuple, Dict
 from datetime import datetime, timedelta
 import re
 
+# PO number patterns, tried in priority order by _extract_po_number_from_text
+_PO_NUMBER_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"PO[:\s#-]*([A-Z0-9-]+)",
+    r"Purchase\s+Order[:\s#-]*([A-Z0-9-]+)",
+    r"P\.O\.\s*[:\s#-]*([A-Z0-9-]+)",
+    r"P\/O[:\s#-]*([A-Z0-9-]+)",
+))
+
+# Columns the linking/validation callers read off matched POs and contracts;
+# the rest (status, file paths, processing flags) stay unloaded
+_LINKING_COLUMNS = load_only(
+    Document.id,
+    Document.title,
+    Document.category,
+    Document.client,
+    Document.vendor,
+    Document.amount,
+    Document.currency,
+    Document.created_at,
+    Document.due_date,
+    Document.po_number
+)
+
+
+def _same_name(a: str, b: str) -> bool:
+    """Case-insensitive name comparison; identical strings (the usual case) skip lower()"""
+    return a == b or a.lower() == b.lower()
+
+
+class POIndex:
+    """
+    In-memory PO lookups for bulk linking, built once per job from a known set of POs.
+    Answers the same questions as the batched queries in link_invoices_to_pos
+    (newest PO first everywhere, ties broken by id) without going back to the database.
+    """
+    
+    def __init__(self, pos: Iterable[Document]):
+        self._pos = sorted(pos, key=lambda po: (po.created_at, po.id), reverse=True)
+        self._by_number: Dict[str, Document] = {}
+        self._by_client: Dict[str, List[Document]] = {}
+        for po in self._pos:
+            if po.po_number:
+                self._by_number.setdefault(po.po_number, po)
+            self._by_client.setdefault(po.client, []).append(po)
+        self._titles = [(po.title.lower(), po) for po in self._pos]
+        self._by_title: Dict[str, Optional[Document]] = {}
+    
+    def find_by_po_number(self, po_number: str) -> Optional[Document]:
+        """Exact po_number match, falling back to the PO number appearing in a PO title"""
+        po = self._by_number.get(po_number)
+        if po is None:
+            if po_number not in self._by_title:
+                needle = po_number.lower()
+                self._by_title[po_number] = next((po for title, po in self._titles if needle in title), None)
+            po = self._by_title[po_number]
+        return po
+    
+    def pos_for_client(self, client: str) -> List[Document]:
+        """All POs for a client, newest first"""
+        return self._by_client.get(client, [])
+
 
 class DocumentLinkingService:
     """Service for linking related documents with multiple strategies"""
     
-    def __init__(self, db: Session):
+    # Max values per IN (...) / OR list in batched lookups, well under SQLite's limits
+    BATCH_SIZE = 500
+    
+    def __init__(self, db: Session, batch_cache: Optional[dict] = None):
         self.db = db
+        # Memoised lookups for one batch job (e.g. a full alert refresh); the caller
+        # sets a fresh dict per batch and clears it afterwards. None disables caching.
+        self.batch_cache = batch_cache
     
     def link_invoice_to_po(self, invoice: Document) -> Optional[Document]:
         """
@@ -33,39 +100,125 @@ class DocumentLinkingService:
         if invoice.category not in ["Client Invoice", "Vendor Invoice"]:
             return None
         
-        # Strategy 1: Exact PO number match (highest priority)
-        if invoice.po_number:
-            po = self._find_po_by_po_number(invoice.po_number)
-            if po:
-                return po
+        # Every strategy becomes a (condition, score) pair; one query returns the candidate
+        # from the highest-priority strategy that matches, newest first within it
+        strategies = []
         
-        # Strategy 2: Extract PO number from invoice title/description
-        po_number_from_title = self._extract_po_number_from_text(invoice.title)
-        if po_number_from_title:
-            po = self._find_po_by_po_number(po_number_from_title)
-            if po:
-                return po
+        # Strategies 1 & 2: PO number from the invoice field, then from the title;
+        # an exact po_number match beats a match in the PO title
+        po_numbers = [invoice.po_number, self._extract_po_number_from_text(invoice.title)]
+        for po_number in filter(None, po_numbers):
+            strategies.append(Document.po_number == po_number)
+            strategies.append(Document.title.contains(po_number))
         
         # Strategy 3: Client + Vendor match with date proximity (within 1 year)
         if invoice.vendor:
-            po = self._find_po_by_client_vendor_date(
-                invoice.client, 
-                invoice.vendor, 
-                invoice.created_at
-            )
-            if po:
-                return po
-        
-        # Strategy 4: Client match with amount similarity (within 20% difference)
-        po = self._find_po_by_client_amount(
-            invoice.client,
-            invoice.amount,
-            invoice.currency
-        )
-        if po:
-            return po
+            strategies.append(and_(
+                Document.client == invoice.client,
+                Document.vendor == invoice.vendor,
+                Document.created_at >= invoice.created_at - timedelta(days=365),
+                Document.created_at <= invoice.created_at + timedelta(days=30)  # PO should be before invoice
+            ))
+        
+        # Strategy 4: Client match with amount similarity (within 20% difference);
+        # skipped for invoices without an amount or currency to compare
+        if invoice.amount and invoice.amount > 0 and invoice.currency is not None:
+            strategies.append(and_(
+                Document.client == invoice.client,
+                Document.currency == invoice.currency,
+                Document.amount >= invoice.amount * 0.8,
+                Document.amount <= invoice.amount * 1.2
+            ))
+        
+        if not strategies:
+            return None
         
-        return None
+        score = case(
+            *[(condition, len(strategies) - rank) for rank, condition in enumerate(strategies)],
+            else_=0
+        )
+        query = self.db.query(Document).options(_LINKING_COLUMNS).filter(
+            Document.category.in_(["Client PO", "Vendor PO"]),
+            or_(*strategies)
+        ).order_by(score.desc(), Document.created_at.desc(), Document.id.desc())
+        return self._cached(
+            ("po_for_invoice", *po_numbers, invoice.client, invoice.vendor,
+             invoice.created_at, invoice.amount, invoice.currency),
+            query.first
+        )
+    
+    def link_invoices_to_pos(self, invoices: List[Document], po_index: Optional[POIndex] = None) -> Dict[str, Optional[Document]]:
+        """
+        Batch version of link_invoice_to_po for many invoices at once.
+        Candidate POs are fetched with a fixed number of queries (PO numbers,
+        title fallbacks, client matches), or taken from po_index when the caller
+        has one, and the same strategies are then applied in Python.
+        Returns {invoice_id: linked PO or None}.
+        """
+        invoices = [inv for inv in invoices if inv.category in ["Client Invoice", "Vendor Invoice"]]
+        if not invoices:
+            return {}
+        
+        # Strategies 1 & 2: PO numbers from the invoice field and from the title
+        title_numbers = {inv.id: self._extract_po_number_from_text(inv.title) for inv in invoices}
+        if po_index is not None:
+            find_by_number = po_index.find_by_po_number
+            pos_for_client = po_index.pos_for_client
+        else:
+            po_numbers = {inv.po_number for inv in invoices if inv.po_number}
+            po_numbers.update(number for number in title_numbers.values() if number)
+            find_by_number = self._find_pos_by_po_numbers(po_numbers).get
+            
+            # Strategies 3 & 4: every PO for the invoices' clients, newest first
+            clients = {inv.client for inv in invoices}
+            pos_by_client: Dict[str, List[Document]] = {}
+            for po in self.db.query(Document).options(_LINKING_COLUMNS).filter(
+                Document.category.in_(["Client PO", "Vendor PO"]),
+                Document.client.in_(clients)
+            ).order_by(Document.created_at.desc(), Document.id.desc()):
+                pos_by_client.setdefault(po.client, []).append(po)
+            pos_for_client = lambda client: pos_by_client.get(client, [])
+        
+        links = {}
+        for invoice in invoices:
+            po = None
+            if invoice.po_number:
+                po = find_by_number(invoice.po_number)
+            if not po and title_numbers[invoice.id]:
+                po = find_by_number(title_numbers[invoice.id])
+            
+            candidates = pos_for_client(invoice.client)
+            if not po and invoice.vendor:
+                # Same window as strategy 3 in link_invoice_to_po
+                date_start = invoice.created_at - timedelta(days=365)
+                date_end = invoice.created_at + timedelta(days=30)
+                po = next((
+                    c for c in candidates
+                    if c.vendor == invoice.vendor and date_start <= c.created_at <= date_end
+                ), None)
+            if not po and invoice.amount and invoice.amount > 0 and invoice.currency is not None:
+                # Same tolerance as strategy 4 in link_invoice_to_po
+                amount_min = invoice.amount * 0.8
+                amount_max = invoice.amount * 1.2
+                po = next((
+                    c for c in candidates
+                    if c.currency == invoice.currency and amount_min <= c.amount <= amount_max
+                ), None)
+            
+            links[invoice.id] = po
+        
+        return links
+    
+    def build_po_index(self, documents: Optional[List[Document]] = None) -> POIndex:
+        """
+        POIndex over every PO, taken from documents when the caller has already loaded
+        the whole table, otherwise read in one pass.
+        """
+        if documents is None:
+            documents = self.db.query(Document).options(_LINKING_COLUMNS).filter(
+                Document.category.in_(["Client PO", "Vendor PO"])
+            ).yield_per(1000)
+        return POIndex(doc for doc in documents if doc.category in ["Client PO", "Vendor PO"])
     
     def link_contract_to_po(self, contract: Document) -> List[Document]:
         """
@@ -80,32 +233,21 @@ class DocumentLinkingService:
         if contract.category != "Service Agreement":
             return []
         
-        linked_pos = []
-        
-        # Strategy 1: Vendor + Client match with date range
-        if contract.vendor and contract.due_date:
-            pos = self._find_pos_by_vendor_client_date_range(
-                contract.vendor,
-                contract.client,
-                contract.created_at,
-                contract.due_date
-            )
-            linked_pos.extend(pos)
+        if not contract.due_date:
+            return []
         
-        # Strategy 2: Client match with date range
-        if contract.due_date:
-            pos = self._find_pos_by_client_date_range(
-                contract.client,
-                contract.created_at,
-                contract.due_date
-            )
-            # Avoid duplicates
-            existing_ids = {po.id for po in linked_pos}
-            for po in pos:
-                if po.id not in existing_ids:
-                    linked_pos.append(po)
+        # Strategy 2 (client + date range) is a superset of strategy 1 (vendor + client +
+        # date range), so one query covers both; vendor matches are ranked first
+        query = self.db.query(Document).options(_LINKING_COLUMNS).filter(
+            Document.category.in_(["Client PO", "Vendor PO"]),
+            Document.client == contract.client,
+            Document.created_at >= contract.created_at,
+            Document.created_at <= contract.due_date
+        )
+        if contract.vendor:
+            query = query.order_by(case((Document.vendor == contract.vendor, 0), else_=1))
         
-        return linked_pos
+        return query.all()
     
     def link_po_to_contract(self, po: Document) -> Optional[Document]:
         """
@@ -144,52 +286,97 @@ class DocumentLinkingService:
     
     def get_linked_pos_for_contract(self, contract: Document) -> List[Document]:
         """Get all POs linked to a specific contract"""
-        # Find POs that reference this contract or match vendor/client
-        pos = []
-        
-        # Direct link (if PO has linked_to pointing to contract)
-        direct_pos = self.db.query(Document).filter(
-            Document.linked_to == contract.id,
-            Document.category.in_(["Client PO", "Vendor PO"])
+        # POs that reference this contract directly or match vendor/client within the
+        # contract period, in one query; direct links come first
+        return self.db.query(Document).filter(
+            Document.category.in_(["Client PO", "Vendor PO"]),
+            self._contract_po_match(contract)
+        ).order_by(case((Document.linked_to == contract.id, 0), else_=1)).all()
+    
+    def find_invoices_outside_range(self, po_id: str, start: datetime, end: datetime) -> List[Tuple[str, str, datetime]]:
+        """
+        Invoices linked to a PO that were created outside [start, end].
+        Returns (id, title, created_at) rows; the date filter runs in the database.
+        """
+        return self.db.query(
+            Document.id,
+            Document.title,
+            Document.created_at
+        ).filter(
+            Document.linked_to == po_id,
+            Document.category.in_(["Client Invoice", "Vendor Invoice"]),
+            or_(Document.created_at < start, Document.created_at > end)
         ).all()
-        pos.extend(direct_pos)
+    
+    def contract_rollup(self, contract: Document) -> Tuple[int, float, int]:
+        """
+        Summarise the POs governed by a contract in a single aggregate query.
+        Covers the same POs as get_linked_pos_for_contract.
+        Returns (po_count, total_po_value, invoice_count).
+        """
+        # Invoice counts per PO, joined once instead of queried per PO
+        invoice_counts = self.db.query(
+            Document.linked_to.label("po_id"),
+            func.count(Document.id).label("invoice_count")
+        ).filter(
+            Document.category.in_(["Client Invoice", "Vendor Invoice"])
+        ).group_by(Document.linked_to).subquery()
+        
+        po_count, total_po_value, invoice_count = self.db.query(
+            func.count(Document.id),
+            func.coalesce(func.sum(Document.amount), 0.0),
+            func.coalesce(func.sum(invoice_counts.c.invoice_count), 0)
+        ).outerjoin(
+            invoice_counts, invoice_counts.c.po_id == Document.id
+        ).filter(
+            Document.category.in_(["Client PO", "Vendor PO"]),
+            self._contract_po_match(contract)
+        ).one()
         
-        # Indirect link (vendor/client match within contract period)
+        return po_count, total_po_value, invoice_count
+    
+    def _contract_po_match(self, contract: Document):
+        """Filter for POs governed by a contract: linked to it, or same vendor/client within its period"""
+        po_match = Document.linked_to == contract.id
         if contract.vendor and contract.due_date:
-            indirect_pos = self._find_pos_by_vendor_client_date_range(
-                contract.vendor,
-                contract.client,
-                contract.created_at,
-                contract.due_date
+            po_match = or_(
+                po_match,
+                and_(
+                    Document.vendor == contract.vendor,
+                    Document.client == contract.client,
+                    Document.created_at >= contract.created_at,
+                    Document.created_at <= contract.due_date
+                )
             )
-            # Avoid duplicates
-            existing_ids = {p.id for p in pos}
-            for p in indirect_pos:
-                if p.id not in existing_ids:
-                    pos.append(p)
-        
-        return pos
+        return po_match
     
-    def calculate_po_consumption(self, po: Document) -> Dict[str, float]:
+    def calculate_po_consumption(self, po: Document, linked_invoices: Optional[List[Document]] = None) -> Dict[str, float]:
         """
         Calculate PO consumption by summing all linked invoices.
+        Pass linked_invoices when the caller already has them loaded.
         Returns a dict with:
         - total_invoiced: Sum of all linked invoice amounts
         - remaining_balance: PO amount - total_invoiced
         - utilization_percentage: (total_invoiced / po.amount) * 100
         """
-        linked_invoices = self.get_linked_invoices(po)
-        
-        # Sum invoice amounts (handle currency conversion if needed)
-        total_invoiced = 0.0
-        for invoice in linked_invoices:
+        if linked_invoices is None:
+            # Aggregate in the database rather than loading every invoice row
+            total_invoiced, linked_invoice_count = self.db.query(
+                func.coalesce(func.sum(Document.amount), 0.0),
+                func.count(Document.id)
+            ).filter(
+                Document.linked_to == po.id,
+                Document.category.in_(["Client Invoice", "Vendor Invoice"])
+            ).one()
+        else:
             # For now, assume same currency (could add currency conversion later)
-            if invoice.currency == po.currency:
-                total_invoiced += invoice.amount
-            else:
-                # Different currency - add anyway but could flag this
-                total_invoiced += invoice.amount
+            total_invoiced = sum(invoice.amount for invoice in linked_invoices)
+            linked_invoice_count = len(linked_invoices)
         
+        return self._consumption_summary(po, total_invoiced, linked_invoice_count)
+    
+    def _consumption_summary(self, po: Document, total_invoiced: float, linked_invoice_count: int) -> Dict[str, float]:
+        """Build the calculate_po_consumption result from a PO's invoiced total"""
         remaining_balance = po.amount - total_invoiced
         utilization_percentage = (total_invoiced / po.amount * 100) if po.amount > 0 else 0
         
@@ -197,19 +384,26 @@ class DocumentLinkingService:
             "total_invoiced": total_invoiced,
             "remaining_balance": remaining_balance,
             "utilization_percentage": utilization_percentage,
-            "linked_invoice_count": len(linked_invoices)
+            "linked_invoice_count": linked_invoice_count
         }
     
-    def validate_invoice_against_po(self, invoice: Document, po: Document) -> Dict[str, any]:
+    def validate_invoice_against_po(
+        self,
+        invoice: Document,
+        po: Document,
+        consumption: Optional[Dict[str, float]] = None
+    ) -> Dict[str, any]:
         """
         Validate an invoice against its linked PO.
+        Pass consumption when the caller already has the PO's consumption computed.
         Returns a dict with validation results and issues found.
         """
         issues = []
         warnings = []
         
         # Check amount
-        consumption = self.calculate_po_consumption(po)
+        if consumption is None:
+            consumption = self.calculate_po_consumption(po)
         if invoice.amount > consumption["remaining_balance"]:
             issues.append({
                 "type": "amount_exceeds_balance",
@@ -230,14 +424,14 @@ class DocumentLinkingService:
         
         # Check vendor (if both have vendor)
         if invoice.vendor and po.vendor:
-            if invoice.vendor.lower() != po.vendor.lower():
+            if not _same_name(invoice.vendor, po.vendor):
                 warnings.append({
                     "type": "vendor_mismatch",
                     "message": f"Invoice vendor ({invoice.vendor}) differs from PO vendor ({po.vendor})"
                 })
         
         # Check client
-        if invoice.client.lower() != po.client.lower():
+        if not _same_name(invoice.client, po.client):
             warnings.append({
                 "type": "client_mismatch",
                 "message": f"Invoice client ({invoice.client}) differs from PO client ({po.client})"
@@ -263,73 +457,96 @@ class DocumentLinkingService:
         Check if a document (PO or invoice) falls within a contract's validity period.
         Returns validation results.
         """
+        return self.check_contracts_validity_bulk([document], contract)[document.id]
+    
+    def check_contracts_validity_bulk(self, documents: List[Document], contract: Document) -> Dict[str, Dict[str, any]]:
+        """
+        Batch version of check_contract_validity_for_document for many documents against one contract.
+        The contract period and days until expiry are computed once; each document is then
+        just two date comparisons. Returns {document_id: validation result}.
+        """
         if not contract.due_date:
             return {
-                "valid": False,
-                "reason": "Contract has no expiration date"
+                document.id: {
+                    "valid": False,
+                    "reason": "Contract has no expiration date"
+                }
+                for document in documents
             }
         
-        # Check if document date is within contract period
         contract_start = contract.created_at
         contract_end = contract.due_date
-        
-        doc_date = document.created_at
-        
-        if doc_date < contract_start:
-            return {
-                "valid": False,
-                "reason": f"Document date ({doc_date.date()}) is before contract start ({contract_start.date()})"
-            }
-        
-        if doc_date > contract_end:
-            return {
-                "valid": False,
-                "reason": f"Document date ({doc_date.date()}) is after contract expiration ({contract_end.date()})"
-            }
-        
-        # Check days until expiration
         days_until_expiry = (contract_end - datetime.utcnow()).days
         
-        return {
-            "valid": True,
-            "within_period": True,
-            "days_until_expiry": days_until_expiry,
-            "contract_start": contract_start,
-            "contract_end": contract_end
-        }
+        results = {}
+        for document in documents:
+            doc_date = document.created_at
+            
+            if doc_date < contract_start:
+                results[document.id] = {
+                    "valid": False,
+                    "reason": f"Document date ({doc_date.date()}) is before contract start ({contract_start.date()})"
+                }
+            elif doc_date > contract_end:
+                results[document.id] = {
+                    "valid": False,
+                    "reason": f"Document date ({doc_date.date()}) is after contract expiration ({contract_end.date()})"
+                }
+            else:
+                results[document.id] = {
+                    "valid": True,
+                    "within_period": True,
+                    "days_until_expiry": days_until_expiry,
+                    "contract_start": contract_start,
+                    "contract_end": contract_end
+                }
+        
+        return results
     
     # Private helper methods
     
-    def _find_po_by_po_number(self, po_number: str) -> Optional[Document]:
-        """Find PO by exact PO number match"""
-        # Try exact match in po_number field
-        po = self.db.query(Document).filter(
-            Document.category.in_(["Client PO", "Vendor PO"]),
-            Document.po_number == po_number
-        ).first()
-        
-        if po:
-            return po
-        
-        # Try partial match in title
-        po = self.db.query(Document).filter(
-            Document.category.in_(["Client PO", "Vendor PO"]),
-            Document.title.contains(po_number)
-        ).first()
-        
-        return po
+    def _cached(self, key: tuple, lookup):
+        """Return lookup() memoised under key in batch_cache, when a batch is active"""
+        if self.batch_cache is None:
+            return lookup()
+        if key not in self.batch_cache:
+            self.batch_cache[key] = lookup()
+        return self.batch_cache[key]
+    
+    def _find_pos_by_po_numbers(self, po_numbers) -> Dict[str, Document]:
+        """PO-number strategies of link_invoice_to_po in batch: {po_number: PO} for the numbers that match"""
+        po_numbers = list(po_numbers)
+        if not po_numbers:
+            return {}
+        
+        found: Dict[str, Document] = {}
+        for i in range(0, len(po_numbers), self.BATCH_SIZE):
+            for po in self.db.query(Document).options(_LINKING_COLUMNS).filter(
+                Document.category.in_(["Client PO", "Vendor PO"]),
+                Document.po_number.in_(po_numbers[i:i + self.BATCH_SIZE])
+            ).order_by(Document.created_at.desc(), Document.id.desc()):
+                found.setdefault(po.po_number, po)
+        
+        # Title fallback for the rest; SQLite's LIKE is ASCII case-insensitive, so compare lowercased
+        missing = [number for number in po_numbers if number not in found]
+        for i in range(0, len(missing), self.BATCH_SIZE):
+            batch = missing[i:i + self.BATCH_SIZE]
+            titled_pos = self.db.query(Document).options(_LINKING_COLUMNS).filter(
+                Document.category.in_(["Client PO", "Vendor PO"]),
+                or_(*[Document.title.contains(number) for number in batch])
+            ).order_by(Document.created_at.desc(), Document.id.desc()).all()
+            for number in batch:
+                needle = number.lower()
+                po = next((po for po in titled_pos if needle in po.title.lower()), None)
+                if po:
+                    found[number] = po
+        
+        return found
     
     def _extract_po_number_from_text(self, text: str) -> Optional[str]:
         """Extract PO number from text using regex patterns"""
-        patterns = [
-            r"PO[:\s#-]*([A-Z0-9-]+)",
-            r"Purchase\s+Order[:\s#-]*([A-Z0-9-]+)",
-            r"P\.O\.\s*[:\s#-]*([A-Z0-9-]+)",
-            r"P\/O[:\s#-]*([A-Z0-9-]+)",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _PO_NUMBER_PATTERNS:
+            match = pattern.search(text)
             if match:
                 po_num = match.group(1).strip()
                 if len(po_num) > 2:
@@ -337,78 +554,6 @@ class DocumentLinkingService:
         
         return None
     
-    def _find_po_by_client_vendor_date(
-        self, 
-        client: str, 
-        vendor: str, 
-        invoice_date: datetime,
-        days_tolerance: int = 365
-    ) -> Optional[Document]:
-        """Find PO by client, vendor, and date proximity"""
-        date_start = invoice_date - timedelta(days=days_tolerance)
-        date_end = invoice_date + timedelta(days=30)  # PO should be before invoice
-        
-        po = self.db.query(Document).filter(
-            Document.category.in_(["Client PO", "Vendor PO"]),
-            Document.client == client,
-            Document.vendor == vendor,
-            Document.created_at >= date_start,
-            Document.created_at <= date_end
-        ).order_by(Document.created_at.desc()).first()
-        
-        return po
-    
-    def _find_po_by_client_amount(
-        self,
-        client: str,
-        amount: float,
-        currency: str,
-        tolerance_percent: float = 0.2
-    ) -> Optional[Document]:
-        """Find PO by client and amount similarity"""
-        amount_min = amount * (1 - tolerance_percent)
-        amount_max = amount * (1 + tolerance_percent)
-        
-        po = self.db.query(Document).filter(
-            Document.category.in_(["Client PO", "Vendor PO"]),
-            Document.client == client,
-            Document.currency == currency,
-            Document.amount >= amount_min,
-            Document.amount <= amount_max
-        ).order_by(Document.created_at.desc()).first()
-        
-        return po
-    
-    def _find_pos_by_vendor_client_date_range(
-        self,
-        vendor: str,
-        client: str,
-        start_date: datetime,
-        end_date: datetime
-    ) -> List[Document]:
-        """Find POs by vendor, client, and date range"""
-        return self.db.query(Document).filter(
-            Document.category.in_(["Client PO", "Vendor PO"]),
-            Document.vendor == vendor,
-            Document.client == client,
-            Document.created_at >= start_date,
-            Document.created_at <= end_date
-        ).all()
-    
-    def _find_pos_by_client_date_range(
-        self,
-        client: str,
-        start_date: datetime,
-        end_date: datetime
-    ) -> List[Document]:
-        """Find POs by client and date range"""
-        return self.db.query(Document).filter(
-            Document.category.in_(["Client PO", "Vendor PO"]),
-            Document.client == client,
-            Document.created_at >= start_date,
-            Document.created_at <= end_date
-        ).all()
-    
     def _find_contract_by_vendor_client_date(
         self,
         vendor: str,
@@ -416,7 +561,13 @@ class DocumentLinkingService:
         po_date: datetime
     ) -> Optional[Document]:
         """Find contract by vendor, client, and date (PO should be within contract period)"""
-        contract = self.db.query(Document).filter(
+        return self._cached(
+            ("contract_by_vendor_client_date", vendor, client, po_date),
+            lambda: self._query_contract_by_vendor_client_date(vendor, client, po_date)
+        )
+    
+    def _query_contract_by_vendor_client_date(self, vendor: str, client: str, po_date: datetime) -> Optional[Document]:
+        contract = self.db.query(Document).options(_LINKING_COLUMNS).filter(
             Document.category == "Service Agreement",
             Document.vendor == vendor,
             Document.client == client,
@@ -435,7 +586,13 @@ class DocumentLinkingService:
         po_date: datetime
     ) -> Optional[Document]:
         """Find contract by client and date"""
-        contract = self.db.query(Document).filter(
+        return self._cached(
+            ("contract_by_client_date", client, po_date),
+            lambda: self._query_contract_by_client_date(client, po_date)
+        )
+    
+    def _query_contract_by_client_date(self, client: str, po_date: datetime) -> Optional[Document]:
+        contract = self.db.query(Document).options(_LINKING_COLUMNS).filter(
             Document.category == "Service Agreement",
             Document.client == client,
             Document.created_at <= po_date,
@@ -1,31 +1,58 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, extract
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import func, and_, case, extract, select, insert, literal, union_all
 from app.models import Document, Exception, Alert
-from app.schemas import DocumentCreate, DocumentUpdate, DashboardInsights, KPIMetric, UtilizationTrend, CategorySplit
-from app.services.document_linking_service import DocumentLinkingService
+from app.schemas import DocumentCreate, DocumentUpdate, DocumentDetailResponse, DashboardInsights, KPIMetric, UtilizationTrend, CategorySplit
+from app.schemas import Alert as AlertSchema, Exception as ExceptionSchema
+from app.services import insights_cache
 from typing import List, Optional
-import uuid
 from datetime import datetime, timedelta
-import json
-import os
+from itertools import cycle
+
+# Category split chart palette, reused in order
+_CATEGORY_COLORS = ("#38bdf8", "#0ea5e9", "#6366f1", "#a855f7", "#f97316")
 
 class DocumentService:
     def __init__(self, db: Session):
         self.db = db
     
     def create_document(self, document: DocumentCreate) -> Document:
-        db_document = Document(
-            id=str(uuid.uuid4()),
-            **document.dict()
-        )
+        db_document = Document(**document.model_dump())
         self.db.add(db_document)
         self.db.commit()
         self.db.refresh(db_document)
         return db_document
     
+    def create_documents(self, documents: List[DocumentCreate]) -> List[Document]:
+        """Create many documents with one batched INSERT and a single commit"""
+        if not documents:
+            return []
+        
+        # ids come from the column default, one per row
+        values = [document.model_dump() for document in documents]
+        db_documents = self.db.scalars(insert(Document).returning(Document), values).all()
+        self.db.commit()
+        # Bulk imports don't go through the document routes, so drop cached insights here
+        insights_cache.invalidate()
+        return db_documents
+    
     def get_document(self, document_id: str) -> Optional[Document]:
         return self.db.query(Document).filter(Document.id == document_id).first()
     
+    def get_document_detail(self, document_id: str) -> Optional[DocumentDetailResponse]:
+        """Get a document together with its exceptions and alerts, loaded in one pass"""
+        document = self.db.query(Document).options(
+            selectinload(Document.exceptions),
+            selectinload(Document.alerts)
+        ).filter(Document.id == document_id).first()
+        if not document:
+            return None
+        
+        return DocumentDetailResponse(
+            document=document,
+            related_exceptions=document.exceptions,
+            related_alerts=document.alerts
+        )
+    
     def get_documents(self, skip: int = 0, limit: int = 100) -> List[Document]:
         return self.db.query(Document).offset(skip).limit(limit).all()
     
@@ -34,7 +61,7 @@ class DocumentService:
         if not db_document:
             return None
         
-        update_data = document.dict(exclude_unset=True)
+        update_data = document.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(db_document, field, value)
         
@@ -52,88 +79,87 @@ class DocumentService:
         return True
     
     def get_dashboard_insights(self) -> DashboardInsights:
-        linking_service = DocumentLinkingService(self.db)
-        
-        # Calculate Active Client POs (approved Client PO documents)
-        active_client_pos = self.db.query(Document).filter(
-            Document.category == "Client PO",
-            Document.status == "Approved"
-        ).count()
-        
-        # Calculate previous period (30 days ago) for comparison
         thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-        active_client_pos_prev = self.db.query(Document).filter(
-            Document.category == "Client PO",
-            Document.status == "Approved",
-            Document.created_at <= thirty_days_ago
-        ).count()
         
-        # Calculate delta for Active Client POs
-        po_delta = self._calculate_percentage_change(active_client_pos_prev, active_client_pos)
-        
-        # Calculate Invoice Utilization (PO consumption)
-        all_pos = self.db.query(Document).filter(
-            Document.category.in_(["Client PO", "Vendor PO"])
-        ).all()
+        # Invoiced total per PO, joined into the aggregate below
+        invoiced = self.db.query(
+            Document.linked_to.label("po_id"),
+            func.sum(Document.amount).label("total_invoiced")
+        ).filter(
+            Document.category.in_(["Client Invoice", "Vendor Invoice"]),
+            Document.linked_to.isnot(None)
+        ).group_by(Document.linked_to).subquery()
         
-        total_po_amount = sum(po.amount for po in all_pos)
-        total_invoiced = 0.0
+        is_active_client_po = and_(Document.category == "Client PO", Document.status == "Approved")
+        is_po = Document.category.in_(["Client PO", "Vendor PO"])
+        is_prev = Document.created_at <= thirty_days_ago
+        po_invoiced = func.coalesce(invoiced.c.total_invoiced, 0.0)
+        # Minutes from ingest to validation; NULL (and so ignored by AVG) until both are recorded
+        processing_minutes = (func.julianday(Document.validated_at) - func.julianday(Document.ingest_at)) * 1440
         
-        for po in all_pos:
-            consumption = linking_service.calculate_po_consumption(po)
-            total_invoiced += consumption["total_invoiced"]
-        
-        invoice_utilization = (total_invoiced / total_po_amount * 100) if total_po_amount > 0 else 0
-        
-        # Calculate previous period utilization
-        pos_prev = self.db.query(Document).filter(
-            Document.category.in_(["Client PO", "Vendor PO"]),
-            Document.created_at <= thirty_days_ago
-        ).all()
+        # Open exceptions, now and 30 days ago, as scalar subqueries of the query below
+        open_exceptions = select(func.count(Exception.id)).where(Exception.resolved == False)
+        open_exceptions_prev = open_exceptions.where(Exception.raised_at <= thirty_days_ago)
         
-        total_po_amount_prev = sum(po.amount for po in pos_prev) if pos_prev else 0
-        total_invoiced_prev = 0.0
+        # All count/sum KPI figures, current and 30 days ago, in one conditional aggregate
+        (
+            active_client_pos,
+            active_client_pos_prev,
+            total_po_amount,
+            total_po_amount_prev,
+            total_invoiced,
+            total_invoiced_prev,
+            exceptions_count,
+            exceptions_prev,
+            avg_processing_time,
+            avg_processing_time_prev
+        ) = self.db.query(
+            func.coalesce(func.sum(case((is_active_client_po, 1), else_=0)), 0),
+            func.coalesce(func.sum(case((and_(is_active_client_po, is_prev), 1), else_=0)), 0),
+            func.coalesce(func.sum(case((is_po, Document.amount), else_=0.0)), 0.0),
+            func.coalesce(func.sum(case((and_(is_po, is_prev), Document.amount), else_=0.0)), 0.0),
+            func.coalesce(func.sum(case((is_po, po_invoiced), else_=0.0)), 0.0),
+            func.coalesce(func.sum(case((and_(is_po, is_prev), po_invoiced), else_=0.0)), 0.0),
+            open_exceptions.scalar_subquery(),
+            open_exceptions_prev.scalar_subquery(),
+            func.coalesce(func.avg(processing_minutes), 0.0),
+            func.coalesce(func.avg(case((Document.validated_at <= thirty_days_ago, processing_minutes))), 0.0)
+        ).select_from(Document).outerjoin(invoiced, invoiced.c.po_id == Document.id).one()
         
-        for po in pos_prev:
-            consumption = linking_service.calculate_po_consumption(po)
-            total_invoiced_prev += consumption["total_invoiced"]
+        # Calculate delta for Active Client POs
+        po_delta = self._calculate_percentage_change(active_client_pos_prev, active_client_pos)
         
+        # Calculate Invoice Utilization (PO consumption), now and for the previous period
+        invoice_utilization = (total_invoiced / total_po_amount * 100) if total_po_amount > 0 else 0
         utilization_prev = (total_invoiced_prev / total_po_amount_prev * 100) if total_po_amount_prev > 0 else 0
         utilization_delta = self._calculate_percentage_change(utilization_prev, invoice_utilization)
         
-        # Get exceptions count
-        exceptions_count = self.db.query(Exception).filter(Exception.resolved == False).count()
-        exceptions_prev = self.db.query(Exception).filter(
-            Exception.resolved == False,
-            Exception.raised_at <= thirty_days_ago
-        ).count()
+        # Exceptions delta
         exceptions_delta = exceptions_count - exceptions_prev
         
-        # Calculate average processing time from processed documents
-        avg_processing_time = self._calculate_avg_processing_time()
-        avg_processing_time_prev = self._calculate_avg_processing_time(thirty_days_ago)
+        # Average processing time delta against the previous period
         processing_time_delta = avg_processing_time - avg_processing_time_prev if avg_processing_time_prev > 0 else 0
         
         kpis = [
-            KPIMetric(
+            KPIMetric.model_construct(
                 label="Active Client POs", 
                 value=str(active_client_pos), 
                 delta=f"{po_delta:+.1f}%", 
                 helper="vs last 30 days"
             ),
-            KPIMetric(
+            KPIMetric.model_construct(
                 label="Invoice Utilization", 
                 value=f"{invoice_utilization:.0f}%", 
                 delta=f"{utilization_delta:+.1f}%", 
                 helper="PO caps consumed"
             ),
-            KPIMetric(
+            KPIMetric.model_construct(
                 label="Exceptions", 
                 value=str(exceptions_count), 
                 delta=f"{exceptions_delta:+d} cases", 
                 helper="open validation issues"
             ),
-            KPIMetric(
+            KPIMetric.model_construct(
                 label="Avg. Processing Time", 
                 value=f"{avg_processing_time:.0f}m", 
                 delta=f"{processing_time_delta:+.0f}m", 
@@ -150,20 +176,16 @@ class DocumentService:
             func.count(Document.id)
         ).group_by(Document.category).all()
         
-        colors = ["#38bdf8", "#0ea5e9", "#6366f1", "#a855f7", "#f97316"]
-        category_split = []
-        for i, (category, count) in enumerate(category_counts):
-            category_split.append(CategorySplit(
-                name=category,
-                value=count,
-                fill=colors[i % len(colors)]
-            ))
+        category_split = [
+            CategorySplit.model_construct(name=category, value=count, fill=fill)
+            for (category, count), fill in zip(category_counts, cycle(_CATEGORY_COLORS))
+        ]
         
-        # Get recent alerts and exceptions
-        alerts = self.db.query(Alert).order_by(Alert.timestamp.desc()).limit(10).all()
-        exceptions = self.db.query(Exception).order_by(Exception.raised_at.desc()).limit(10).all()
+        # Recent alerts and exceptions: both top-10 lists in one UNION ALL, told apart by kind
+        alerts, exceptions = self._recent_alerts_and_exceptions(10)
         
-        return DashboardInsights(
+        # Everything below comes from our own queries and aggregation, so skip validation
+        return DashboardInsights.model_construct(
             kpis=kpis,
             utilizationTrend=utilization_trend,
             categorySplit=category_split,
@@ -171,48 +193,53 @@ class DocumentService:
             exceptions=exceptions
         )
     
+    def _recent_alerts_and_exceptions(self, limit: int):
+        """Newest alerts and newest exceptions as response models, fetched in a single query"""
+        recent_alerts = select(
+            literal("alert").label("kind"),
+            Alert.id,
+            Alert.document_id,
+            Alert.title.label("text_1"),
+            Alert.description.label("text_2"),
+            Alert.level.label("text_3"),
+            Alert.timestamp.label("ts"),
+            Alert.acknowledged.label("flag")
+        ).order_by(Alert.timestamp.desc()).limit(limit).subquery()
+        recent_exceptions = select(
+            literal("exception").label("kind"),
+            Exception.id,
+            Exception.document_id,
+            Exception.issue,
+            Exception.severity,
+            Exception.owner,
+            Exception.raised_at,
+            Exception.resolved
+        ).order_by(Exception.raised_at.desc()).limit(limit).subquery()
+        combined = union_all(select(recent_alerts), select(recent_exceptions)).subquery()
+        rows = self.db.execute(
+            select(combined).order_by(combined.c.kind, combined.c.ts.desc())
+        ).all()
+        
+        alerts, exceptions = [], []
+        for kind, id, document_id, text_1, text_2, text_3, ts, flag in rows:
+            if kind == "alert":
+                alerts.append(AlertSchema.model_construct(
+                    title=text_1, description=text_2, level=text_3, document_id=document_id,
+                    id=id, timestamp=ts, acknowledged=flag
+                ))
+            else:
+                exceptions.append(ExceptionSchema.model_construct(
+                    document_id=document_id, issue=text_1, severity=text_2, owner=text_3,
+                    id=id, raised_at=ts, resolved=flag
+                ))
+        return alerts, exceptions
+    
     def _calculate_percentage_change(self, old_value: float, new_value: float) -> float:
         """Calculate percentage change between two values"""
         if old_value == 0:
             return 100.0 if new_value > 0 else 0.0
         return ((new_value - old_value) / old_value) * 100
     
-    def _calculate_avg_processing_time(self, before_date: Optional[datetime] = None) -> float:
-        """Calculate average processing time from processed documents JSON files"""
-        processed_dir = "./processed"
-        if not os.path.exists(processed_dir):
-            return 0.0
-        
-        processing_times = []
-        
-        for filename in os.listdir(processed_dir):
-            if not filename.endswith('.json'):
-                continue
-            
-            file_path = os.path.join(processed_dir, filename)
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    processing_time_str = data.get('processing_time', '')
-                    
-                    if processing_time_str:
-                        # Parse ISO format datetime
-                        try:
-                            processing_time = datetime.fromisoformat(processing_time_str.replace('Z', '+00:00'))
-                            if before_date is None or processing_time <= before_date:
-                                # For now, we'll estimate processing time as 2-5 minutes
-                                # In a real system, you'd track actual processing duration
-                                processing_times.append(3.0)  # Default estimate
-                        except:
-                            pass
-            except:
-                continue
-        
-        if not processing_times:
-            return 0.0
-        
-        return sum(processing_times) / len(processing_times)
-    
     def _calculate_utilization_trend(self) -> List[UtilizationTrend]:
         """
         Calculate monthly document activity trend from last 6 months.
@@ -222,33 +249,40 @@ class DocumentService:
         now = datetime.utcnow()
         trend = []
         
-        # Get last 6 months
-        for i in range(5, -1, -1):  # 5 months ago to current month
-            month_start = datetime(now.year, now.month, 1) - timedelta(days=30 * i)
-            month_end = month_start + timedelta(days=30)
-            
-            # Get Client documents (Client PO + Client Invoice) created in this month
-            client_docs = self.db.query(Document).filter(
-                Document.category.in_(["Client PO", "Client Invoice"]),
-                Document.created_at >= month_start,
-                Document.created_at < month_end
-            ).all()
-            
-            # Get Vendor documents (Vendor PO + Vendor Invoice) created in this month
-            vendor_docs = self.db.query(Document).filter(
-                Document.category.in_(["Vendor PO", "Vendor Invoice"]),
-                Document.created_at >= month_start,
-                Document.created_at < month_end
-            ).all()
+        # Last 6 calendar months, 5 months ago to current month
+        months = []
+        for i in range(5, -1, -1):
+            year, month = divmod(now.year * 12 + now.month - 1 - i, 12)
+            months.append(datetime(year, month + 1, 1))
+        next_year, next_month = divmod(now.year * 12 + now.month, 12)
+        range_end = datetime(next_year, next_month + 1, 1)
+        
+        # Client documents (Client PO + Client Invoice) and Vendor documents (Vendor PO +
+        # Vendor Invoice) summed per calendar month in one grouped query
+        month_key = func.strftime("%Y-%m", Document.created_at)
+        rows = self.db.query(
+            month_key,
+            func.sum(case((Document.category.in_(["Client PO", "Client Invoice"]), Document.amount), else_=0.0)),
+            func.sum(case((Document.category.in_(["Vendor PO", "Vendor Invoice"]), Document.amount), else_=0.0))
+        ).filter(
+            Document.category.in_(["Client PO", "Client Invoice", "Vendor PO", "Vendor Invoice"]),
+            Document.created_at >= months[0],
+            Document.created_at < range_end
+        ).group_by(month_key).all()
+        totals = {key: (client, vendor) for key, client, vendor in rows}
+        
+        for month_start in months:
+            # Months without documents stay at zero
+            client_total, vendor_total = totals.get(month_start.strftime("%Y-%m"), (0, 0))
             
             # Sum amounts for the month (in thousands for display)
-            client_monthly = sum(doc.amount for doc in client_docs) / 1000
-            vendor_monthly = sum(doc.amount for doc in vendor_docs) / 1000
+            client_monthly = (client_total or 0) / 1000
+            vendor_monthly = (vendor_total or 0) / 1000
             
             # Month abbreviation
             month_name = month_start.strftime("%b")
             
-            trend.append(UtilizationTrend(
+            trend.append(UtilizationTrend.model_construct(
                 month=month_name,
                 client=int(client_monthly) if client_monthly > 0 else 0,
                 vendor=int(vendor_monthly) if vendor_monthly > 0 else 0
@@ -1,23 +1,33 @@
 from sqlalchemy.orm import Session
+from sqlalchemy import insert
 from app.models import Exception
 from app.schemas import ExceptionCreate, ExceptionUpdate
+from app.services import insights_cache
 from typing import List, Optional
-import uuid
 
 class ExceptionService:
     def __init__(self, db: Session):
         self.db = db
     
     def create_exception(self, exception: ExceptionCreate) -> Exception:
-        db_exception = Exception(
-            id=str(uuid.uuid4()),
-            **exception.dict()
-        )
+        db_exception = Exception(**exception.model_dump())
         self.db.add(db_exception)
         self.db.commit()
         self.db.refresh(db_exception)
         return db_exception
     
+    def create_exceptions(self, exceptions: List[ExceptionCreate]) -> List[Exception]:
+        """Create many exceptions with one batched INSERT and a single commit"""
+        if not exceptions:
+            return []
+        
+        values = [exception.model_dump() for exception in exceptions]
+        db_exceptions = self.db.scalars(insert(Exception).returning(Exception), values).all()
+        self.db.commit()
+        # Bulk writes don't go through the exception routes, so drop cached insights here
+        insights_cache.invalidate()
+        return db_exceptions
+    
     def get_exception(self, exception_id: str) -> Optional[Exception]:
         return self.db.query(Exception).filter(Exception.id == exception_id).first()
     
@@ -32,7 +42,7 @@ class ExceptionService:
         if not db_exception:
             return None
         
-        update_data = exception.dict(exclude_unset=True)
+        update_data = exception.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(db_exception, field, value)
         
@@ -0,0 +1,47 @@
+import asyncio
+import hashlib
+from typing import Callable, NamedTuple
+from cachetools import TTLCache
+from starlette.concurrency import run_in_threadpool
+from app.config import settings
+from app.schemas import DashboardInsights, DashboardInsightsAdapter
+
+# Dashboard insights are polled frequently but change at human time scale, so the
+# computed result is kept for a short TTL and dropped on any write that affects it.
+_CACHE_KEY = "dashboard_insights"
+_cache: TTLCache = TTLCache(maxsize=1, ttl=settings.dashboard_cache_ttl)
+_lock = asyncio.Lock()
+_generation = 0
+
+class InsightsPayload(NamedTuple):
+    """Serialized insights and their ETag, computed once per cache fill"""
+    body: bytes
+    etag: str
+
+def _build_payload(compute: Callable[[], DashboardInsights]) -> InsightsPayload:
+    body = DashboardInsightsAdapter.dump_json(compute())
+    return InsightsPayload(body, '"%s"' % hashlib.blake2b(body, digest_size=8).hexdigest())
+
+async def get_dashboard_payload(compute: Callable[[], DashboardInsights]) -> InsightsPayload:
+    """Return cached serialized insights, computing them at most once per TTL window"""
+    payload = _cache.get(_CACHE_KEY)
+    if payload is not None:
+        return payload
+    
+    async with _lock:
+        # Another request may have filled the cache while we waited for the lock
+        payload = _cache.get(_CACHE_KEY)
+        if payload is None:
+            generation = _generation
+            # The queries are blocking; run them off the event loop so other requests proceed
+            payload = await run_in_threadpool(_build_payload, compute)
+            # Don't store a result computed before an invalidation that happened meanwhile
+            if generation == _generation:
+                _cache[_CACHE_KEY] = payload
+    return payload
+
+def invalidate() -> None:
+    """Drop cached insights after documents, alerts or exceptions change"""
+    global _generation
+    _generation += 1
+    _cache.clear()
@@ -2,12 +2,231 @@ import os
 import re
 import uuid
 import time
+import hashlib
+import threading
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import boto3
 from botocore.exceptions import ClientError, BotoCoreError
+from cachetools import LRUCache
+from starlette.concurrency import run_in_threadpool
 from app.config import settings
 
+# Keywords whose presence scores a document for each type when classifying it
+_CLASSIFICATION_KEYWORDS = {
+    "Client PO": ("purchase order", "client", "po", "order from"),
+    "Vendor PO": ("purchase order", "vendor", "supplier", "order to"),
+    "Client Invoice": ("invoice", "client", "bill to", "invoice to"),
+    "Vendor Invoice": ("invoice", "vendor", "supplier", "invoice from"),
+    "Service Agreement": ("agreement", "contract", "service", "terms and conditions"),
+}
+
+# Keywords that raise confidence in an assigned document type
+_CONFIDENCE_KEYWORDS = {
+    "Client PO": ("purchase order", "client", "po", "order", "requisition"),
+    "Vendor PO": ("purchase order", "vendor", "supplier", "order", "requisition"),
+    "Client Invoice": ("invoice", "client", "bill", "statement", "receipt"),
+    "Vendor Invoice": ("invoice", "vendor", "supplier", "bill", "statement"),
+    "Service Agreement": ("agreement", "contract", "service", "terms", "conditions"),
+}
+
+# Field extraction patterns, compiled once at import and tried in priority order
+
+_TITLE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"Title:\s*(.+?)(?:\n|$)",
+    r"Subject:\s*(.+?)(?:\n|$)",
+    r"Document:\s*(.+?)(?:\n|$)",
+    r"INVOICE\s+(.+?)(?:\n|$)",
+    r"PURCHASE ORDER\s+(.+?)(?:\n|$)",
+    r"AGREEMENT\s+(.+?)(?:\n|$)",
+))
+
+_TITLE_COMPANY_PATTERNS = tuple(re.compile(pattern, re.MULTILINE) for pattern in (
+    r"^([A-Z][A-Z\s&]+(?:LTD|LLC|INC|CORP|COMPANY))",
+    r"^([A-Z][A-Z\s&]+(?:TECHNOLOGY|SERVICES|SOLUTIONS))",
+    r"^([A-Z][A-Z\s&]+(?:DIGITAL|INFORMATION))",
+))
+
+# Company names in document headers, used as the client/vendor fallback
+_COMPANY_PATTERNS = tuple(re.compile(pattern, re.MULTILINE) for pattern in (
+    r"^([A-Z][A-Z\s&]+(?:LTD|LLC|INC|CORP|COMPANY|LLP))",
+    r"^([A-Z][A-Z\s&]+(?:TECHNOLOGY|SERVICES|SOLUTIONS|SYSTEMS))",
+    r"^([A-Z][A-Z\s&]+(?:DIGITAL|INFORMATION|CONSULTING))",
+))
+
+_CLIENT_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE | re.MULTILINE) for pattern in (
+    r"Bill\s+To[:\s]*\n\s*([A-Z][^\n]{5,100}?)(?:\n|$)",
+    r"Client:\s*(.+?)(?:\n|$)",
+    r"Customer:\s*(.+?)(?:\n|$)",
+    r"Bill\s+To[:\s]*(.+?)(?:\n|$)",
+    r"Billed\s+To[:\s]*(.+?)(?:\n|$)",
+))
+
+_VENDOR_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE | re.MULTILINE) for pattern in (
+    r"Vendor:\s*(.+?)(?:\n|$)",
+    r"Supplier:\s*(.+?)(?:\n|$)",
+    r"From:\s*(.+?)(?:\n|$)",
+    r"Vendor\s+Name[:\s]*(.+?)(?:\n|$)",
+    r"Supplier\s+Name[:\s]*(.+?)(?:\n|$)",
+    r"Company\s+Name[:\s]*(.+?)(?:\n|$)",
+    r"Business\s+Name[:\s]*(.+?)(?:\n|$)",
+))
+
+# Invoice total, amount due, grand total first; highest priority is the total including VAT
+_AMOUNT_PRIORITY_PATTERNS = tuple((re.compile(pattern, re.IGNORECASE), priority) for pattern, priority in (
+    (r"Total\s+Incl(?:uding)?\s+VAT[:\s\|]*[A-Z]{3}\s+([\d,]+\.?\d*)", 1.0),  # "Total Incl VAT | AED 4,473.48"
+    (r"Total\s+Incl(?:uding)?\s+VAT[:\s\|]*([\d,]+\.?\d*)", 0.99),  # Without currency code
+    (r"Invoice\s+Total\s+[A-Z]{3}[:\s]*([\d,]+\.?\d*)", 0.95),
+    (r"Amount\s+Due\s+[A-Z]{3}[:\s]*([\d,]+\.?\d*)", 0.94),
+    (r"Grand\s+Total[:\s]*\$?([\d,]+\.?\d*)", 0.9),
+    (r"Total\s+[A-Z]{3}[:\s]*([\d,]+\.?\d*)", 0.85),
+    (r"Final\s+Amount[:\s]*\$?([\d,]+\.?\d*)", 0.8),
+))
+
+_AMOUNT_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"Total\s+Incl(?:uding)?\s+VAT[:\s\|]*[A-Z]{3}\s+([\d,]+\.?\d*)",  # "Total Incl VAT | AED 4,473.48"
+    r"Total\s+Incl(?:uding)?\s+VAT[:\s\|]*([\d,]+\.?\d*)",  # Total including VAT without currency
+    r"Invoice\s+Total[:\s]*\$?([\d,]+\.?\d*)",
+    r"Amount\s+Due[:\s]*\$?([\d,]+\.?\d*)",
+    r"Grand\s+Total[:\s]*\$?([\d,]+\.?\d*)",
+    r"Total\s+Amount[:\s]*\$?([\d,]+\.?\d*)",
+    r"Final\s+Amount[:\s]*\$?([\d,]+\.?\d*)",
+    r"Net\s+Amount[:\s]*\$?([\d,]+\.?\d*)",
+    r"Total[:\s]*\$?([\d,]+\.?\d*)",
+    r"Amount[:\s]*\$?([\d,]+\.?\d*)",
+    r"Balance[:\s]*\$?([\d,]+\.?\d*)",
+    r"Due[:\s]*\$?([\d,]+\.?\d*)",
+))
+
+# Currency codes near invoice total or amount due
+_CURRENCY_LABEL_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'Invoice\s+Total\s+([A-Z]{3})',  # Highest priority
+    r'Amount\s+Due\s+([A-Z]{3})',
+    r'Total\s+([A-Z]{3})',
+    r'Currency\s+([A-Z]{3})',
+))
+
+_CURRENCY_SYMBOLS = tuple((re.compile(pattern), currency) for pattern, currency in (
+    (r'\$', 'USD'),
+    (r'€', 'EUR'),
+    (r'£', 'GBP'),
+    (r'¥', 'JPY'),
+    (r'₹', 'INR'),
+    (r'₽', 'RUB'),
+    (r'₩', 'KRW'),
+    (r'₪', 'ILS'),
+    (r'₦', 'NGN'),
+    (r'₨', 'PKR'),
+))
+
+_CURRENCY_CODES = tuple((re.compile(rf'\b{code}\b', re.IGNORECASE), code) for code in (
+    'AED', 'USD', 'EUR', 'GBP', 'JPY', 'INR',
+    'RUB', 'KRW', 'ILS', 'NGN', 'PKR',
+    'CAD', 'AUD', 'CHF', 'CNY', 'SEK',
+    'NOK', 'DKK', 'PLN', 'CZK', 'HUF',
+))
+
+# (pattern, needs_parsing): True for "13 Sep 2025" style dates, False for "13/09/2025"
+_DATE_PATTERNS = tuple((re.compile(pattern, re.IGNORECASE | re.MULTILINE), needs_parsing) for pattern, needs_parsing in (
+    # Format: "13 Sep 2025" or "13 September 2025"
+    (r"Invoice\s+Date[:\s]*\n\s*(\d{1,2}\s+[A-Za-z]+\s+\d{4})", True),
+    (r"Date[:\s]*\n\s*(\d{1,2}\s+[A-Za-z]+\s+\d{4})", True),
+    # Format: "13/09/2025" or "13-09-2025"
+    (r"Invoice\s+Date[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})", False),
+    (r"Date[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})", False),
+    (r"Issue\s+Date[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})", False),
+    (r"Created[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})", False),
+))
+
+_DUE_DATE_PATTERNS = tuple((re.compile(pattern, re.IGNORECASE | re.MULTILINE), needs_parsing) for pattern, needs_parsing in (
+    # Format: "13 Nov 2025" or "13 November 2025"
+    (r"Due\s+Date[:\s]*\n\s*(\d{1,2}\s+[A-Za-z]+\s+\d{4})", True),
+    (r"Due\s+Date[:\s]*(\d{1,2}\s+[A-Za-z]+\s+\d{4})", True),
+    (r"Payment\s+Due[:\s]*(\d{1,2}\s+[A-Za-z]+\s+\d{4})", True),
+    (r"Expiry\s+Date[:\s]*(\d{1,2}\s+[A-Za-z]+\s+\d{4})", True),
+    (r"Expiration\s+Date[:\s]*(\d{1,2}\s+[A-Za-z]+\s+\d{4})", True),
+    (r"Valid\s+Until[:\s]*(\d{1,2}\s+[A-Za-z]+\s+\d{4})", True),
+    (r"End\s+Date[:\s]*(\d{1,2}\s+[A-Za-z]+\s+\d{4})", True),
+    # Format: "13/11/2025" or "13-11-2025"
+    (r"Due\s+Date[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})", False),
+    (r"Payment\s+Due[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})", False),
+    (r"Expiry\s+Date[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})", False),
+    (r"Expiration\s+Date[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})", False),
+    (r"Valid\s+Until[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})", False),
+    (r"End\s+Date[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})", False),
+))
+
+# PO number patterns (fallback) - Reference is deliberately excluded
+_PO_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE | re.MULTILINE) for pattern in (
+    r"PO\s+Number[:\s]*\n\s*([A-Z0-9/_-]+)",
+    r"Purchase\s+Order\s+Number[:\s]*\n\s*([A-Z0-9/_-]+)",
+    r"PO\s*#?\s*([A-Z0-9/_-]+)",
+    r"Purchase\s+Order\s*#?\s*([A-Z0-9/_-]+)",
+    r"P\.O\.\s*#?\s*([A-Z0-9/_-]+)",
+    r"PO\s+Number[:\s]*([A-Z0-9/_-]+)",
+    r"Order\s+Number[:\s]*([A-Z0-9/_-]+)",
+))
+
+_INVOICE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE | re.MULTILINE) for pattern in (
+    r"Invoice\s+Number[:\s]*\n\s*([A-Z0-9/_-]+)",
+    r"Invoice\s*#?\s*([A-Z0-9/_-]+)",
+    r"Inv\s*#?\s*([A-Z0-9/_-]+)",
+    r"Bill\s*#?\s*([A-Z0-9/_-]+)",
+    r"Invoice\s+Number[:\s]*([A-Z0-9/_-]+)",
+    r"Bill\s+Number[:\s]*([A-Z0-9/_-]+)",
+))
+
+_FINANCIAL_TERM_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"Total[:\s]*([A-Z]{3}\s*[\d,]+\.?\d*)",
+    r"Amount[:\s]*([A-Z]{3}\s*[\d,]+\.?\d*)",
+    r"Due[:\s]*([A-Z]{3}\s*[\d,]+\.?\d*)",
+    r"Payment[:\s]*([A-Z]{3}\s*[\d,]+\.?\d*)",
+))
+
+_DOC_NUMBER_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"PO[:\s]*([A-Z0-9-]+)",
+    r"Invoice[:\s]*([A-Z0-9-]+)",
+    r"Reference[:\s]*([A-Z0-9-]+)",
+))
+
+# Phone numbers: +? followed by 10-11 digits with optional formatting
+# Examples: +1-234-567-8900, (123) 456-7890, 123-456-7890, +971501234567
+_PHONE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    # International format with +: +1-234-567-8900, +971-50-123-4567
+    r'\+\d{1,3}[\s\-]?\d{1,4}[\s\-]?\d{1,4}[\s\-]?\d{4,6}',
+    # Standard format with parentheses: (123) 456-7890
+    r'\(?\d{3}\)?[\s\-]?\d{3}[\s\-]?\d{4}',
+    # Simple format: 123-456-7890, 123.456.7890, 123 456 7890
+    r'\d{3}[\s\-\.]?\d{3}[\s\-\.]?\d{4}',
+    # 11 digits with extension: 123-456-7890-1
+    r'\d{3}[\s\-]?\d{3}[\s\-]?\d{4}[\s\-]?\d{1}',
+))
+
+# Address lines contain a number or mention a street or city/postal term. Only
+# whether anything matches is used, so the alternatives share one pattern.
+_ADDRESS_LINE_RE = re.compile(
+    r'\d+'
+    r'|(street|st|avenue|ave|road|rd|boulevard|blvd|drive|dr|lane|ln)'
+    r'|(city|state|zip|postal|postal code)',
+    re.IGNORECASE,
+)
+
+_TEXT_DATE_RE = re.compile(r'(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})', re.IGNORECASE)
+_NUMERIC_DATE_RE = re.compile(r'(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})')
+_IDENTIFIER_RE = re.compile(r'([A-Z0-9/_-]+)')
+_MONEY_RE = re.compile(r'\$[\d,]+\.?\d*')
+_DOC_REF_RE = re.compile(r'[A-Z]{2,}\s*#?\s*[A-Z0-9-]+')
+_ADDRESS_RE = re.compile(r'([A-Za-z\s]+,\s*[A-Za-z\s]+,\s*[A-Z]{2,3})')
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_WHITESPACE_RE = re.compile(r'\s+')
+_NON_DIGIT_RE = re.compile(r'\D')
+_ID_LIKE_RE = re.compile(r'^[A-Z0-9\-]+$')
+_PHONE_FORMATTING_RE = re.compile(r'[\s\-\(\)\.]')
+_PHONE_SEPARATOR_RE = re.compile(r'[\s\-\(\)]')
+
+# Indicators of a structured business document, scored by _calculate_confidence
+_STRUCTURE_INDICATORS = (_MONEY_RE, _NUMERIC_DATE_RE, _DOC_REF_RE, _ADDRESS_RE, _EMAIL_RE)
+
 class PDFProcessor:
     def __init__(self):
         self.upload_dir = "./uploads"
@@ -25,6 +244,11 @@ class PDFProcessor:
         self.textract_client = None
         self.s3_client = None
         self._initialize_aws_clients()
+        
+        # Textract text by PDF content digest, so re-uploads of the same file skip the job.
+        # process_pdf runs in worker threads, hence the lock around the cache.
+        self._text_cache: LRUCache = LRUCache(maxsize=settings.textract_cache_size)
+        self._text_cache_lock = threading.Lock()
     
     def _initialize_aws_clients(self):
         """Initialize AWS Textract and S3 clients with credentials from settings"""
@@ -49,6 +273,12 @@ class PDFProcessor:
     
     async def process_pdf(self, file_path: str) -> Dict:
         """Process a PDF file and extract structured data using Amazon Textract with S3-based async processing"""
+        # The S3 upload and Textract polling block for up to several minutes; run them
+        # in a worker thread so the event loop keeps serving other requests and uploads
+        return await run_in_threadpool(self._process_pdf_sync, file_path)
+    
+    def _process_pdf_sync(self, file_path: str) -> Dict:
+        """Blocking body of process_pdf"""
         temp_s3_key = None
         try:
             if not self.textract_client or not self.s3_client:
@@ -85,18 +315,18 @@ class PDFProcessor:
                     "processing_time": datetime.now().isoformat()
                 }
             
-            # Read PDF file
-            with open(file_path, 'rb') as document:
-                pdf_bytes = document.read()
-            
-            # Validate PDF file size (S3-based processing supports up to 500MB)
-            if len(pdf_bytes) > 500 * 1024 * 1024:  # 500MB limit
+            # Validate PDF file size (S3-based processing supports up to 500MB).
+            # upload_file streams the file itself, so there is no need to read it here.
+            file_size = os.path.getsize(file_path)
+            if file_size > 500 * 1024 * 1024:  # 500MB limit
                 return {
                     "success": False,
-                    "error": f"PDF file is too large ({len(pdf_bytes) / 1024 / 1024:.2f}MB). Maximum size is 500MB.",
+                    "error": f"PDF file is too large ({file_size / 1024 / 1024:.2f}MB). Maximum size is 500MB.",
                     "processing_time": datetime.now().isoformat()
                 }
             
+            content_digest = self._content_digest(file_path)
+            
             # Generate unique S3 key for this PDF (temporary location for processing)
             temp_s3_key = f"textract-processing/{uuid.uuid4()}/{filename}"
             
@@ -116,39 +346,48 @@ class PDFProcessor:
                     "processing_time": datetime.now().isoformat()
                 }
             
-            # Start async Textract job
-            try:
-                response = self.textract_client.start_document_text_detection(
-                    DocumentLocation={
-                        'S3Object': {
-                            'Bucket': settings.aws_s3_bucket,
-                            'Name': temp_s3_key
+            # Reuse the text of identical content processed earlier instead of running another job
+            with self._text_cache_lock:
+                text_content = self._text_cache.get(content_digest)
+            if text_content:
+                print(f"♻️  Reusing Textract result for identical content")
+            else:
+                # Start async Textract job
+                try:
+                    response = self.textract_client.start_document_text_detection(
+                        DocumentLocation={
+                            'S3Object': {
+                                'Bucket': settings.aws_s3_bucket,
+                                'Name': temp_s3_key
+                            }
                         }
+                    )
+                    job_id = response['JobId']
+                    print(f"🔄 Started Textract job: {job_id}")
+                except ClientError as e:
+                    error_code = e.response.get('Error', {}).get('Code', 'Unknown')
+                    error_message = e.response.get('Error', {}).get('Message', str(e))
+                    # Clean up S3 file
+                    self._cleanup_s3_file(temp_s3_key)
+                    return {
+                        "success": False,
+                        "error": f"AWS Textract error ({error_code}): {error_message}",
+                        "processing_time": datetime.now().isoformat()
                     }
-                )
-                job_id = response['JobId']
-                print(f"🔄 Started Textract job: {job_id}")
-            except ClientError as e:
-                error_code = e.response.get('Error', {}).get('Code', 'Unknown')
-                error_message = e.response.get('Error', {}).get('Message', str(e))
-                # Clean up S3 file
-                self._cleanup_s3_file(temp_s3_key)
-                return {
-                    "success": False,
-                    "error": f"AWS Textract error ({error_code}): {error_message}",
-                    "processing_time": datetime.now().isoformat()
-                }
-            
-            # Poll for job completion
-            text_content = self._wait_for_textract_job(job_id)
-            if not text_content:
-                # Clean up S3 file
-                self._cleanup_s3_file(temp_s3_key)
-                return {
-                    "success": False,
-                    "error": "Textract job failed or timed out",
-                    "processing_time": datetime.now().isoformat()
-                }
+                
+                # Poll for job completion
+                text_content = self._wait_for_textract_job(job_id)
+                if not text_content:
+                    # Clean up S3 file
+                    self._cleanup_s3_file(temp_s3_key)
+                    return {
+                        "success": False,
+                        "error": "Textract job failed or timed out",
+                        "processing_time": datetime.now().isoformat()
+                    }
+                
+                with self._text_cache_lock:
+                    self._text_cache[content_digest] = text_content
             
             # Classify document type
             document_type = self._classify_document(text_content)
@@ -249,6 +488,14 @@ class PDFProcessor:
         print(f"Textract job timed out after {max_wait_time} seconds")
         return None
     
+    def _content_digest(self, file_path: str) -> bytes:
+        """Digest of the PDF's bytes, used to recognise re-uploads of identical content"""
+        digest = hashlib.blake2b()
+        with open(file_path, 'rb') as document:
+            for chunk in iter(lambda: document.read(1 << 17), b""):
+                digest.update(chunk)
+        return digest.digest()
+    
     def _check_file_exists_in_s3(self, filename: str) -> Optional[str]:
         """Check if a file with the given filename already exists in any S3 folder"""
         if not self.s3_client or not settings.aws_s3_bucket:
@@ -511,23 +758,15 @@ class PDFProcessor:
         """Classify document type using keyword matching"""
         text_lower = text.lower()
         
-        # Define keywords for each document type
-        type_keywords = {
-            "Client PO": ["purchase order", "client", "po", "order from"],
-            "Vendor PO": ["purchase order", "vendor", "supplier", "order to"],
-            "Client Invoice": ["invoice", "client", "bill to", "invoice to"],
-            "Vendor Invoice": ["invoice", "vendor", "supplier", "invoice from"],
-            "Service Agreement": ["agreement", "contract", "service", "terms and conditions"]
+        scores = {
+            doc_type: sum(keyword in text_lower for keyword in keywords)
+            for doc_type, keywords in _CLASSIFICATION_KEYWORDS.items()
         }
         
-        scores = {}
-        for doc_type, keywords in type_keywords.items():
-            score = sum(1 for keyword in keywords if keyword in text_lower)
-            scores[doc_type] = score
-        
-        # Return the type with highest score, or "Unknown" if no match
-        if scores and max(scores.values()) > 0:
-            return max(scores, key=scores.get)
+        # Return the type with highest score (first listed on ties), or "Unknown" if no match
+        best_type = max(scores, key=scores.get)
+        if scores[best_type] > 0:
+            return best_type
         
         return "Unknown"
     
@@ -535,19 +774,21 @@ class PDFProcessor:
         """Extract structured data based on document type"""
         # Combine text and forms data for better extraction
         combined_text = f"{text}\n{forms_data}" if forms_data else text
+        # Stripped once here for the field extractors rather than by each of them
+        clean_text = combined_text.strip()
         
         extracted = {
-            "title": self._extract_title(combined_text),
-            "client": self._extract_client(combined_text),
-            "vendor": self._extract_vendor(combined_text),
-            "amount": self._extract_amount(combined_text),
-            "currency": self._extract_currency(combined_text),
-            "date": self._extract_date(combined_text),
-            "due_date": self._extract_due_date(combined_text),
-            "po_number": self._extract_po_number(combined_text),
-            "invoice_number": self._extract_invoice_number(combined_text),
-            "vendor_address": self._extract_vendor_address(combined_text),
-            "client_address": self._extract_client_address(combined_text),
+            "title": self._extract_title(clean_text),
+            "client": self._extract_client(clean_text),
+            "vendor": self._extract_vendor(clean_text),
+            "amount": self._extract_amount(clean_text),
+            "currency": self._extract_currency(clean_text),
+            "date": self._extract_date(clean_text),
+            "due_date": self._extract_due_date(clean_text),
+            "po_number": self._extract_po_number(clean_text),
+            "invoice_number": self._extract_invoice_number(clean_text),
+            "vendor_address": self._extract_vendor_address(clean_text),
+            "client_address": self._extract_client_address(clean_text),
             "summary": self._extract_summary(combined_text),
             "key_terms": self._extract_key_terms(combined_text),
             "contact_info": self._extract_contact_info(combined_text)
@@ -555,36 +796,19 @@ class PDFProcessor:
         
         return extracted
     
-    def _extract_title(self, text: str) -> str:
+    def _extract_title(self, clean_text: str) -> str:
         """Extract document title"""
-        clean_text = text.strip()
-        
         # Look for common title patterns
-        patterns = [
-            r"Title:\s*(.+?)(?:\n|$)",
-            r"Subject:\s*(.+?)(?:\n|$)",
-            r"Document:\s*(.+?)(?:\n|$)",
-            r"INVOICE\s+(.+?)(?:\n|$)",
-            r"PURCHASE ORDER\s+(.+?)(?:\n|$)",
-            r"AGREEMENT\s+(.+?)(?:\n|$)"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, clean_text, re.IGNORECASE)
+        for pattern in _TITLE_PATTERNS:
+            match = pattern.search(clean_text)
             if match:
                 title = match.group(1).strip()
                 if len(title) > 5 and len(title) < 100:
                     return title
         
         # Look for company names or document headers
-        company_patterns = [
-            r"^([A-Z][A-Z\s&]+(?:LTD|LLC|INC|CORP|COMPANY))",
-            r"^([A-Z][A-Z\s&]+(?:TECHNOLOGY|SERVICES|SOLUTIONS))",
-            r"^([A-Z][A-Z\s&]+(?:DIGITAL|INFORMATION))"
-        ]
-        
-        for pattern in company_patterns:
-            match = re.search(pattern, clean_text, re.MULTILINE)
+        for pattern in _TITLE_COMPANY_PATTERNS:
+            match = pattern.search(clean_text)
             if match:
                 title = match.group(1).strip()
                 if len(title) > 5 and len(title) < 80:
@@ -599,9 +823,8 @@ class PDFProcessor:
         
         return "Document"
     
-    def _extract_client(self, text: str) -> str:
+    def _extract_client(self, clean_text: str) -> str:
         """Extract client name with improved patterns"""
-        clean_text = text.strip()
         lines = clean_text.split('\n')
         
         # Look for "Bill To" and get the company name on the next line(s)
@@ -625,39 +848,25 @@ class PDFProcessor:
                             break
                 if client_parts:
                     client = ' '.join(client_parts).strip()
-                    client = re.sub(r'\s+', ' ', client)
+                    client = _WHITESPACE_RE.sub(' ', client)
                     if len(client) > 3 and len(client) < 150:
                         return client
         
         # Enhanced patterns for client extraction (fallback)
-        patterns = [
-            r"Bill\s+To[:\s]*\n\s*([A-Z][^\n]{5,100}?)(?:\n|$)",
-            r"Client:\s*(.+?)(?:\n|$)",
-            r"Customer:\s*(.+?)(?:\n|$)",
-            r"Bill\s+To[:\s]*(.+?)(?:\n|$)",
-            r"Billed\s+To[:\s]*(.+?)(?:\n|$)",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, clean_text, re.IGNORECASE | re.MULTILINE)
+        for pattern in _CLIENT_PATTERNS:
+            match = pattern.search(clean_text)
             if match:
                 client = match.group(1).strip()
                 # Skip if it's just a label
                 if client.lower() in ['shipped to', 'ship to', 'deliver to']:
                     continue
-                client = re.sub(r'\s+', ' ', client)
+                client = _WHITESPACE_RE.sub(' ', client)
                 if len(client) > 3 and len(client) < 150:
                     return client
         
         # Look for company names in document headers
-        company_patterns = [
-            r"^([A-Z][A-Z\s&]+(?:LTD|LLC|INC|CORP|COMPANY|LLP))",
-            r"^([A-Z][A-Z\s&]+(?:TECHNOLOGY|SERVICES|SOLUTIONS|SYSTEMS))",
-            r"^([A-Z][A-Z\s&]+(?:DIGITAL|INFORMATION|CONSULTING))"
-        ]
-        
-        for pattern in company_patterns:
-            match = re.search(pattern, clean_text, re.MULTILINE)
+        for pattern in _COMPANY_PATTERNS:
+            match = pattern.search(clean_text)
             if match:
                 company = match.group(1).strip()
                 if len(company) > 5 and len(company) < 80:
@@ -665,38 +874,20 @@ class PDFProcessor:
         
         return "Unknown Client"
     
-    def _extract_vendor(self, text: str) -> str:
+    def _extract_vendor(self, clean_text: str) -> str:
         """Extract vendor name with improved patterns"""
-        clean_text = text.strip()
-        
         # Enhanced patterns for vendor extraction
-        patterns = [
-            r"Vendor:\s*(.+?)(?:\n|$)",
-            r"Supplier:\s*(.+?)(?:\n|$)",
-            r"From:\s*(.+?)(?:\n|$)",
-            r"Vendor\s+Name[:\s]*(.+?)(?:\n|$)",
-            r"Supplier\s+Name[:\s]*(.+?)(?:\n|$)",
-            r"Company\s+Name[:\s]*(.+?)(?:\n|$)",
-            r"Business\s+Name[:\s]*(.+?)(?:\n|$)"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, clean_text, re.IGNORECASE | re.MULTILINE)
+        for pattern in _VENDOR_PATTERNS:
+            match = pattern.search(clean_text)
             if match:
                 vendor = match.group(1).strip()
-                vendor = re.sub(r'\s+', ' ', vendor)
+                vendor = _WHITESPACE_RE.sub(' ', vendor)
                 if len(vendor) > 3 and len(vendor) < 100:
                     return vendor
         
         # Look for company names in document headers (for vendor invoices)
-        company_patterns = [
-            r"^([A-Z][A-Z\s&]+(?:LTD|LLC|INC|CORP|COMPANY|LLP))",
-            r"^([A-Z][A-Z\s&]+(?:TECHNOLOGY|SERVICES|SOLUTIONS|SYSTEMS))",
-            r"^([A-Z][A-Z\s&]+(?:DIGITAL|INFORMATION|CONSULTING))"
-        ]
-        
-        for pattern in company_patterns:
-            match = re.search(pattern, clean_text, re.MULTILINE)
+        for pattern in _COMPANY_PATTERNS:
+            match = pattern.search(clean_text)
             if match:
                 company = match.group(1).strip()
                 if len(company) > 5 and len(company) < 80:
@@ -704,26 +895,12 @@ class PDFProcessor:
         
         return None
     
-    def _extract_amount(self, text: str) -> float:
+    def _extract_amount(self, clean_text: str) -> float:
         """Extract monetary amount with improved patterns - prioritize totals over subtotals"""
-        clean_text = text.strip()
-        lines = clean_text.split('\n')
-        
         # Priority patterns - look for invoice total, amount due, grand total first
-        # Highest priority: Total including VAT (final amount)
-        priority_patterns = [
-            (r"Total\s+Incl(?:uding)?\s+VAT[:\s\|]*[A-Z]{3}\s+([\d,]+\.?\d*)", 1.0),  # "Total Incl VAT | AED 4,473.48"
-            (r"Total\s+Incl(?:uding)?\s+VAT[:\s\|]*([\d,]+\.?\d*)", 0.99),  # Without currency code
-            (r"Invoice\s+Total\s+[A-Z]{3}[:\s]*([\d,]+\.?\d*)", 0.95),
-            (r"Amount\s+Due\s+[A-Z]{3}[:\s]*([\d,]+\.?\d*)", 0.94),
-            (r"Grand\s+Total[:\s]*\$?([\d,]+\.?\d*)", 0.9),
-            (r"Total\s+[A-Z]{3}[:\s]*([\d,]+\.?\d*)", 0.85),
-            (r"Final\s+Amount[:\s]*\$?([\d,]+\.?\d*)", 0.8),
-        ]
-        
         amounts_with_priority = []
-        for pattern, priority in priority_patterns:
-            matches = re.findall(pattern, clean_text, re.IGNORECASE)
+        for pattern, priority in _AMOUNT_PRIORITY_PATTERNS:
+            matches = pattern.findall(clean_text)
             for match in matches:
                 try:
                     amount_str = match.replace(',', '')
@@ -739,24 +916,9 @@ class PDFProcessor:
             return amounts_with_priority[0][0]
         
         # Fallback to all patterns
-        patterns = [
-            r"Total\s+Incl(?:uding)?\s+VAT[:\s\|]*[A-Z]{3}\s+([\d,]+\.?\d*)",  # "Total Incl VAT | AED 4,473.48"
-            r"Total\s+Incl(?:uding)?\s+VAT[:\s\|]*([\d,]+\.?\d*)",  # Total including VAT without currency
-            r"Invoice\s+Total[:\s]*\$?([\d,]+\.?\d*)",
-            r"Amount\s+Due[:\s]*\$?([\d,]+\.?\d*)",
-            r"Grand\s+Total[:\s]*\$?([\d,]+\.?\d*)",
-            r"Total\s+Amount[:\s]*\$?([\d,]+\.?\d*)",
-            r"Final\s+Amount[:\s]*\$?([\d,]+\.?\d*)",
-            r"Net\s+Amount[:\s]*\$?([\d,]+\.?\d*)",
-            r"Total[:\s]*\$?([\d,]+\.?\d*)",
-            r"Amount[:\s]*\$?([\d,]+\.?\d*)",
-            r"Balance[:\s]*\$?([\d,]+\.?\d*)",
-            r"Due[:\s]*\$?([\d,]+\.?\d*)",
-        ]
-        
         amounts = []
-        for pattern in patterns:
-            matches = re.findall(pattern, clean_text, re.IGNORECASE)
+        for pattern in _AMOUNT_PATTERNS:
+            matches = pattern.findall(clean_text)
             for match in matches:
                 try:
                     amount_str = match.replace(',', '')
@@ -772,61 +934,31 @@ class PDFProcessor:
         
         return 0.0
     
-    def _extract_currency(self, text: str) -> str:
+    def _extract_currency(self, clean_text: str) -> str:
         """Extract currency with improved detection - look for currency codes near amounts"""
-        clean_text = text.strip()
-        
         # Look for currency codes near invoice total or amount due
-        currency_patterns = [
-            (r'Invoice\s+Total\s+([A-Z]{3})', 1.0),  # Highest priority
-            (r'Amount\s+Due\s+([A-Z]{3})', 0.95),
-            (r'Total\s+([A-Z]{3})', 0.9),
-            (r'Currency\s+([A-Z]{3})', 0.85),
-        ]
-        
-        for pattern, priority in currency_patterns:
-            match = re.search(pattern, clean_text, re.IGNORECASE)
+        for pattern in _CURRENCY_LABEL_PATTERNS:
+            match = pattern.search(clean_text)
             if match:
                 currency = match.group(1).upper()
                 if currency in ['USD', 'EUR', 'GBP', 'JPY', 'INR', 'AED', 'CAD', 'AUD', 'CHF', 'CNY']:
                     return currency
         
         # Currency symbol patterns
-        currency_symbols = [
-            (r'\$', 'USD'),
-            (r'€', 'EUR'),
-            (r'£', 'GBP'),
-            (r'¥', 'JPY'),
-            (r'₹', 'INR'),
-            (r'₽', 'RUB'),
-            (r'₩', 'KRW'),
-            (r'₪', 'ILS'),
-            (r'₦', 'NGN'),
-            (r'₨', 'PKR')
-        ]
-        
-        for pattern, currency in currency_symbols:
-            if re.search(pattern, clean_text):
+        for pattern, currency in _CURRENCY_SYMBOLS:
+            if pattern.search(clean_text):
                 return currency
         
         # Currency code patterns
-        currency_codes = [
-            r'\bAED\b', r'\bUSD\b', r'\bEUR\b', r'\bGBP\b', r'\bJPY\b', r'\bINR\b',
-            r'\bRUB\b', r'\bKRW\b', r'\bILS\b', r'\bNGN\b', r'\bPKR\b',
-            r'\bCAD\b', r'\bAUD\b', r'\bCHF\b', r'\bCNY\b', r'\bSEK\b',
-            r'\bNOK\b', r'\bDKK\b', r'\bPLN\b', r'\bCZK\b', r'\bHUF\b'
-        ]
-        
-        for code in currency_codes:
-            if re.search(code, clean_text, re.IGNORECASE):
-                return code.replace('\\b', '').upper()
+        for pattern, code in _CURRENCY_CODES:
+            if pattern.search(clean_text):
+                return code
         
         # Default to USD if no currency found
         return 'USD'
     
-    def _extract_date(self, text: str) -> str:
+    def _extract_date(self, clean_text: str) -> str:
         """Extract document date with improved patterns - handles multiple date formats"""
-        clean_text = text.strip()
         lines = clean_text.split('\n')
         
         # Look for "Invoice Date" or "Date" label and get the value on the next line
@@ -843,19 +975,8 @@ class PDFProcessor:
                             return date_str
         
         # Enhanced date patterns - handle multiple formats
-        patterns = [
-            # Format: "13 Sep 2025" or "13 September 2025"
-            (r"Invoice\s+Date[:\s]*\n\s*(\d{1,2}\s+[A-Za-z]+\s+\d{4})", True),
-            (r"Date[:\s]*\n\s*(\d{1,2}\s+[A-Za-z]+\s+\d{4})", True),
-            # Format: "13/09/2025" or "13-09-2025"
-            (r"Invoice\s+Date[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})", False),
-            (r"Date[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})", False),
-            (r"Issue\s+Date[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})", False),
-            (r"Created[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})", False),
-        ]
-        
-        for pattern, needs_parsing in patterns:
-            match = re.search(pattern, clean_text, re.IGNORECASE | re.MULTILINE)
+        for pattern, needs_parsing in _DATE_PATTERNS:
+            match = pattern.search(clean_text)
             if match:
                 date_str = match.group(1)
                 if needs_parsing:
@@ -895,7 +1016,7 @@ class PDFProcessor:
             'dec': '12', 'december': '12'
         }
         # Pattern: "13 Sep 2025" or "13 September 2025"
-        match = re.search(r'(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})', date_str, re.IGNORECASE)
+        match = _TEXT_DATE_RE.search(date_str)
         if match:
             day, month, year = match.groups()
             month_lower = month.lower()
@@ -904,12 +1025,11 @@ class PDFProcessor:
                 return f"{year}-{month_num}-{day.zfill(2)}"
         return None
     
-    def _extract_due_date(self, text: str) -> Optional[str]:
+    def _extract_due_date(self, clean_text: str) -> Optional[str]:
         """Extract due date with improved patterns - handles multiple date formats
         Works for all document types: PO, Invoice, Contract, Service Agreement
         Looks for: Due Date, Payment Due, Expiry Date, Valid Until, End Date, Expiration Date
         """
-        clean_text = text.strip()
         lines = clean_text.split('\n')
         
         # Look for various date labels (due date, expiry date, valid until, etc.)
@@ -931,7 +1051,7 @@ class PDFProcessor:
                         if date_str:
                             return date_str
                         # Try standard date formats
-                        date_match = re.search(r'(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})', next_line)
+                        date_match = _NUMERIC_DATE_RE.search(next_line)
                         if date_match:
                             date_str = date_match.group(1)
                             try:
@@ -947,26 +1067,8 @@ class PDFProcessor:
                                 continue
         
         # Enhanced due date patterns - handle multiple formats for all document types
-        patterns = [
-            # Format: "13 Nov 2025" or "13 November 2025"
-            (r"Due\s+Date[:\s]*\n\s*(\d{1,2}\s+[A-Za-z]+\s+\d{4})", True),
-            (r"Due\s+Date[:\s]*(\d{1,2}\s+[A-Za-z]+\s+\d{4})", True),
-            (r"Payment\s+Due[:\s]*(\d{1,2}\s+[A-Za-z]+\s+\d{4})", True),
-            (r"Expiry\s+Date[:\s]*(\d{1,2}\s+[A-Za-z]+\s+\d{4})", True),
-            (r"Expiration\s+Date[:\s]*(\d{1,2}\s+[A-Za-z]+\s+\d{4})", True),
-            (r"Valid\s+Until[:\s]*(\d{1,2}\s+[A-Za-z]+\s+\d{4})", True),
-            (r"End\s+Date[:\s]*(\d{1,2}\s+[A-Za-z]+\s+\d{4})", True),
-            # Format: "13/11/2025" or "13-11-2025"
-            (r"Due\s+Date[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})", False),
-            (r"Payment\s+Due[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})", False),
-            (r"Expiry\s+Date[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})", False),
-            (r"Expiration\s+Date[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})", False),
-            (r"Valid\s+Until[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})", False),
-            (r"End\s+Date[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})", False),
-        ]
-        
-        for pattern, needs_parsing in patterns:
-            match = re.search(pattern, clean_text, re.IGNORECASE | re.MULTILINE)
+        for pattern, needs_parsing in _DUE_DATE_PATTERNS:
+            match = pattern.search(clean_text)
             if match:
                 date_str = match.group(1)
                 if needs_parsing:
@@ -988,9 +1090,8 @@ class PDFProcessor:
         
         return None
     
-    def _extract_po_number(self, text: str) -> Optional[str]:
+    def _extract_po_number(self, clean_text: str) -> Optional[str]:
         """Extract PO number with improved patterns - exclude Reference field"""
-        clean_text = text.strip()
         lines = clean_text.split('\n')
         
         # Look for PO-related labels and get the value
@@ -1003,25 +1104,15 @@ class PDFProcessor:
                     next_line = lines[j].strip()
                     if next_line and len(next_line) > 2:
                         # Extract alphanumeric PO number
-                        po_match = re.search(r'([A-Z0-9/_-]+)', next_line)
+                        po_match = _IDENTIFIER_RE.search(next_line)
                         if po_match:
                             po_number = po_match.group(1).strip()
                             if len(po_number) > 2:
                                 return po_number
         
         # Enhanced PO number patterns (fallback) - exclude Reference
-        patterns = [
-            r"PO\s+Number[:\s]*\n\s*([A-Z0-9/_-]+)",
-            r"Purchase\s+Order\s+Number[:\s]*\n\s*([A-Z0-9/_-]+)",
-            r"PO\s*#?\s*([A-Z0-9/_-]+)",
-            r"Purchase\s+Order\s*#?\s*([A-Z0-9/_-]+)",
-            r"P\.O\.\s*#?\s*([A-Z0-9/_-]+)",
-            r"PO\s+Number[:\s]*([A-Z0-9/_-]+)",
-            r"Order\s+Number[:\s]*([A-Z0-9/_-]+)",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, clean_text, re.IGNORECASE | re.MULTILINE)
+        for pattern in _PO_PATTERNS:
+            match = pattern.search(clean_text)
             if match:
                 po_number = match.group(1).strip()
                 # Skip if it looks like a person's name (common in Reference field)
@@ -1030,9 +1121,8 @@ class PDFProcessor:
         
         return None
     
-    def _extract_invoice_number(self, text: str) -> Optional[str]:
+    def _extract_invoice_number(self, clean_text: str) -> Optional[str]:
         """Extract invoice number with improved patterns"""
-        clean_text = text.strip()
         lines = clean_text.split('\n')
         
         # Look for "Invoice Number" label and get the value on the next line
@@ -1044,24 +1134,15 @@ class PDFProcessor:
                     next_line = lines[j].strip()
                     if next_line and len(next_line) > 2:
                         # Extract alphanumeric invoice number (may contain /, -, etc.)
-                        invoice_match = re.search(r'([A-Z0-9/_-]+)', next_line)
+                        invoice_match = _IDENTIFIER_RE.search(next_line)
                         if invoice_match:
                             invoice_number = invoice_match.group(1).strip()
                             if len(invoice_number) > 2:
                                 return invoice_number
         
         # Enhanced invoice number patterns (fallback)
-        patterns = [
-            r"Invoice\s+Number[:\s]*\n\s*([A-Z0-9/_-]+)",
-            r"Invoice\s*#?\s*([A-Z0-9/_-]+)",
-            r"Inv\s*#?\s*([A-Z0-9/_-]+)",
-            r"Bill\s*#?\s*([A-Z0-9/_-]+)",
-            r"Invoice\s+Number[:\s]*([A-Z0-9/_-]+)",
-            r"Bill\s+Number[:\s]*([A-Z0-9/_-]+)",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, clean_text, re.IGNORECASE | re.MULTILINE)
+        for pattern in _INVOICE_PATTERNS:
+            match = pattern.search(clean_text)
             if match:
                 invoice_number = match.group(1).strip()
                 if len(invoice_number) > 2:
@@ -1069,9 +1150,8 @@ class PDFProcessor:
         
         return None
     
-    def _extract_vendor_address(self, text: str) -> Optional[str]:
+    def _extract_vendor_address(self, clean_text: str) -> Optional[str]:
         """Extract vendor address with improved patterns"""
-        clean_text = text.strip()
         lines = clean_text.split('\n')
         
         # Enhanced vendor address patterns
@@ -1084,9 +1164,7 @@ class PDFProcessor:
                 for j in range(i+1, min(i+6, len(lines))):
                     current_line = lines[j].strip()
                     if current_line and len(current_line) > 5:
-                        if (re.search(r'\d+', current_line) or
-                            re.search(r'(street|st|avenue|ave|road|rd|boulevard|blvd|drive|dr|lane|ln)', current_line, re.IGNORECASE) or
-                            re.search(r'(city|state|zip|postal|postal code)', current_line, re.IGNORECASE)):
+                        if _ADDRESS_LINE_RE.search(current_line):
                             address_lines.append(current_line)
                         elif len(address_lines) > 0:
                             break
@@ -1096,9 +1174,8 @@ class PDFProcessor:
         
         return None
     
-    def _extract_client_address(self, text: str) -> Optional[str]:
+    def _extract_client_address(self, clean_text: str) -> Optional[str]:
         """Extract client address with improved patterns"""
-        clean_text = text.strip()
         lines = clean_text.split('\n')
         
         # Enhanced client address patterns
@@ -1111,9 +1188,7 @@ class PDFProcessor:
                 for j in range(i+1, min(i+6, len(lines))):
                     current_line = lines[j].strip()
                     if current_line and len(current_line) > 5:
-                        if (re.search(r'\d+', current_line) or
-                            re.search(r'(street|st|avenue|ave|road|rd|boulevard|blvd|drive|dr|lane|ln)', current_line, re.IGNORECASE) or
-                            re.search(r'(city|state|zip|postal|postal code)', current_line, re.IGNORECASE)):
+                        if _ADDRESS_LINE_RE.search(current_line):
                             address_lines.append(current_line)
                         elif len(address_lines) > 0:
                             break
@@ -1137,44 +1212,30 @@ class PDFProcessor:
             confidence += 0.1
         
         # Increase confidence based on document structure indicators
-        structure_indicators = [
-            r'\$[\d,]+\.?\d*',
-            r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}',
-            r'[A-Z]{2,}\s*#?\s*[A-Z0-9-]+',
-            r'[A-Za-z\s]+,\s*[A-Za-z\s]+,\s*[A-Z]{2,3}',
-            r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        ]
-        
         structure_matches = 0
-        for pattern in structure_indicators:
-            if re.search(pattern, text):
+        for pattern in _STRUCTURE_INDICATORS:
+            if pattern.search(text):
                 structure_matches += 1
         
-        confidence += (structure_matches / len(structure_indicators)) * 0.2
+        confidence += (structure_matches / len(_STRUCTURE_INDICATORS)) * 0.2
         
         # Increase confidence based on document type keywords
-        type_keywords = {
-            "Client PO": ["purchase order", "client", "po", "order", "requisition"],
-            "Vendor PO": ["purchase order", "vendor", "supplier", "order", "requisition"],
-            "Client Invoice": ["invoice", "client", "bill", "statement", "receipt"],
-            "Vendor Invoice": ["invoice", "vendor", "supplier", "bill", "statement"],
-            "Service Agreement": ["agreement", "contract", "service", "terms", "conditions"]
-        }
-        
-        if document_type in type_keywords:
-            keywords = type_keywords[document_type]
-            matches = sum(1 for keyword in keywords if keyword.lower() in text.lower())
+        if document_type in _CONFIDENCE_KEYWORDS:
+            keywords = _CONFIDENCE_KEYWORDS[document_type]
+            # Keywords are already lowercase; lowercase the text once rather than per keyword
+            text_lower = text.lower()
+            matches = sum(keyword in text_lower for keyword in keywords)
             confidence += (matches / len(keywords)) * 0.2
         
         # Increase confidence based on extracted data quality
         extracted_data_quality = 0
-        if re.search(r'\$[\d,]+\.?\d*', text):
+        if _MONEY_RE.search(text):
             extracted_data_quality += 0.1
-        if re.search(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}', text):
+        if _NUMERIC_DATE_RE.search(text):
             extracted_data_quality += 0.1
-        if re.search(r'[A-Z]{2,}\s*#?\s*[A-Z0-9-]+', text):
+        if _DOC_REF_RE.search(text):
             extracted_data_quality += 0.1
-        if re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text):
+        if _EMAIL_RE.search(text):
             extracted_data_quality += 0.1
         
         confidence += extracted_data_quality
@@ -1210,26 +1271,13 @@ class PDFProcessor:
         key_terms = []
         
         # Financial terms
-        financial_patterns = [
-            r"Total[:\s]*([A-Z]{3}\s*[\d,]+\.?\d*)",
-            r"Amount[:\s]*([A-Z]{3}\s*[\d,]+\.?\d*)",
-            r"Due[:\s]*([A-Z]{3}\s*[\d,]+\.?\d*)",
-            r"Payment[:\s]*([A-Z]{3}\s*[\d,]+\.?\d*)"
-        ]
-        
-        for pattern in financial_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in _FINANCIAL_TERM_PATTERNS:
+            matches = pattern.findall(text)
             key_terms.extend(matches)
         
         # Document numbers
-        doc_patterns = [
-            r"PO[:\s]*([A-Z0-9-]+)",
-            r"Invoice[:\s]*([A-Z0-9-]+)",
-            r"Reference[:\s]*([A-Z0-9-]+)"
-        ]
-        
-        for pattern in doc_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in _DOC_NUMBER_PATTERNS:
+            matches = pattern.findall(text)
             key_terms.extend(matches)
         
         return list(set(key_terms))[:10]
@@ -1239,8 +1287,7 @@ class PDFProcessor:
         contact_info = {}
         
         # Email addresses
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
+        emails = _EMAIL_RE.findall(text)
         if emails:
             contact_info['emails'] = emails[:3]
         
@@ -1255,19 +1302,6 @@ class PDFProcessor:
                           'po number', 'purchase order', 'account number', 'account no',
                           'document number', 'doc number', 'file number']
         
-        # Pattern for phone numbers: +? followed by 10-11 digits with optional formatting
-        # Examples: +1-234-567-8900, (123) 456-7890, 123-456-7890, +971501234567
-        phone_patterns = [
-            # International format with +: +1-234-567-8900, +971-50-123-4567
-            r'\+\d{1,3}[\s\-]?\d{1,4}[\s\-]?\d{1,4}[\s\-]?\d{4,6}',
-            # Standard format with parentheses: (123) 456-7890
-            r'\(?\d{3}\)?[\s\-]?\d{3}[\s\-]?\d{4}',
-            # Simple format: 123-456-7890, 123.456.7890, 123 456 7890
-            r'\d{3}[\s\-\.]?\d{3}[\s\-\.]?\d{4}',
-            # 11 digits with extension: 123-456-7890-1
-            r'\d{3}[\s\-]?\d{3}[\s\-]?\d{4}[\s\-]?\d{1}',
-        ]
-        
         for i, line in enumerate(lines):
             line_lower = line.lower().strip()
             
@@ -1281,11 +1315,11 @@ class PDFProcessor:
             phone_keywords = ['phone', 'tel', 'mobile', 'cell', 'contact', 'fax']
             has_phone_keyword = any(keyword in line_lower for keyword in phone_keywords)
             
-            for pattern in phone_patterns:
-                matches = re.findall(pattern, line)
+            for pattern in _PHONE_PATTERNS:
+                matches = pattern.findall(line)
                 for match in matches:
                     # Count actual digits in the match
-                    digit_count = len(re.sub(r'\D', '', match))
+                    digit_count = len(_NON_DIGIT_RE.sub('', match))
                     
                     # Must be exactly 10 or 11 digits
                     if digit_count != 10 and digit_count != 11:
@@ -1295,13 +1329,13 @@ class PDFProcessor:
                     # Reference numbers often have specific patterns (all caps, specific lengths, etc.)
                     # If the match is in a line with excluded labels nearby, skip it
                     match_upper = match.upper()
-                    if re.match(r'^[A-Z0-9\-]+$', match_upper) and not has_phone_keyword:
+                    if _ID_LIKE_RE.match(match_upper) and not has_phone_keyword:
                         # If it's all uppercase alphanumeric and no phone keyword, likely not a phone
                         if len(match.replace('-', '').replace(' ', '')) > 10:
                             continue
                     
                     # Clean up the phone number
-                    cleaned = re.sub(r'[\s\-\(\)\.]', '', match)
+                    cleaned = _PHONE_FORMATTING_RE.sub('', match)
                     # If it starts with +, keep it
                     if match.startswith('+'):
                         cleaned = '+' + cleaned.lstrip('+')
@@ -1309,7 +1343,7 @@ class PDFProcessor:
                     # Additional validation: if no phone keyword, be more strict
                     # Must have formatting (spaces, dashes, parentheses) or start with +
                     if not has_phone_keyword:
-                        if not (re.search(r'[\s\-\(\)]', match) or match.startswith('+')):
+                        if not (_PHONE_SEPARATOR_RE.search(match) or match.startswith('+')):
                             # If it's just digits without formatting and no phone keyword, skip
                             continue
                     
@@ -1327,8 +1361,7 @@ class PDFProcessor:
             contact_info['phones'] = phones[:3]
         
         # Addresses (simple pattern)
-        address_pattern = r'([A-Za-z\s]+,\s*[A-Za-z\s]+,\s*[A-Z]{2,3})'
-        addresses = re.findall(address_pattern, text)
+        addresses = _ADDRESS_RE.findall(text)
         if addresses:
             contact_info['addresses'] = addresses[:2]
         
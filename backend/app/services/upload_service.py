@@ -2,7 +2,7 @@ import os
 import uuid
 import asyncio
 import re
-from typing import List, Set
+from typing import List, Optional, Set
 from datetime import datetime
 from fastapi import UploadFile
 from sqlalchemy.orm import Session
@@ -15,10 +15,10 @@ class UploadService:
     # Class-level set to track files currently being processed (shared across instances)
     _processing_files: Set[str] = set()
     
-    def __init__(self):
+    def __init__(self, pdf_processor: Optional[PDFProcessor] = None):
         self.upload_dir = settings.upload_dir
         self.max_file_size = settings.max_file_size
-        self.pdf_processor = PDFProcessor()
+        self.pdf_processor = pdf_processor or PDFProcessor()
     
     def _sanitize_filename(self, filename: str) -> str:
         """Sanitize filename to prevent path traversal and other security issues"""
@@ -204,6 +204,7 @@ class UploadService:
         
         # Mark file as being processed
         self._processing_files.add(filename)
+        ingest_at = datetime.utcnow()
         
         try:
             # Process the PDF (will upload to S3 and process with Textract)
@@ -229,11 +230,12 @@ class UploadService:
                             result["document_db_id"] = existing_doc.id
                             return result
                         
-                        document = self._save_to_database(result, filename, db)
+                        document = self._save_to_database(result, filename, db, ingest_at=ingest_at)
                         if document:
                             # Generate alerts for the new document
                             alert_generator = AlertGenerator(db)
                             alerts = alert_generator.generate_alerts_for_document(document)
+                            document.validated_at = datetime.utcnow()
                             db.commit()
                             result["alerts_generated"] = len(alerts)
                             result["document_db_id"] = document.id
@@ -249,8 +251,8 @@ class UploadService:
             await asyncio.sleep(2)  # Wait 2 seconds before allowing re-processing
             self._processing_files.discard(filename)
     
-    def _save_to_database(self, result: dict, filename: str, db: Session):
-        """Save processed document to database"""
+    def _save_to_database(self, result: dict, filename: str, db: Session, ingest_at: Optional[datetime] = None):
+        """Save processed document to database, recording when its processing started"""
         from app.models import Document
         from app.services.document_service import DocumentService
         
@@ -307,7 +309,8 @@ class UploadService:
         # Create new document with the extracted document_id
         db_document = Document(
             id=document_id,
-            **document_create.dict()
+            ingest_at=ingest_at,
+            **document_create.model_dump()
         )
         db.add(db_document)
         db.commit()
@@ -0,0 +1,60 @@
+import os
+import stat
+
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import FileResponse, Response
+from starlette.types import Receive, Scope, Send
+
+
+class UploadFileResponse(FileResponse):
+    # Fewer, larger reads than Starlette's 64 KiB default when streaming PDFs
+    chunk_size = 131072
+
+
+class UploadFilesApp:
+    """Serve files from a single flat directory as a bare ASGI app.
+
+    Replaces StaticFiles for the /uploads mount: the requested name is resolved
+    once, checked against the upload directory, and stat'ed a single time; the
+    stat result is handed to FileResponse so it does not stat the file again.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = os.path.realpath(directory)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        assert scope["type"] == "http"
+
+        method = scope["method"]
+        if method not in ("GET", "HEAD"):
+            raise HTTPException(status_code=405)
+
+        full_path = self._resolve(scope["path"])
+        if full_path is None:
+            raise HTTPException(status_code=404)
+
+        try:
+            stat_result = os.stat(full_path)
+        except (FileNotFoundError, NotADirectoryError):
+            raise HTTPException(status_code=404)
+        if not stat.S_ISREG(stat_result.st_mode):
+            raise HTTPException(status_code=404)
+
+        response = UploadFileResponse(full_path, stat_result=stat_result, method=method)
+        request_headers = Headers(scope=scope)
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match is not None and if_none_match == response.headers.get("etag"):
+            response = Response(status_code=304, headers={"etag": if_none_match})
+
+        await response(scope, receive, send)
+
+    def _resolve(self, path: str):
+        """Map the request path to a file inside the upload directory, or None if it escapes it"""
+        relative = os.path.normpath(path.lstrip("/"))
+        if relative in (".", "") or relative.startswith(".."):
+            return None
+        full_path = os.path.realpath(os.path.join(self.directory, relative))
+        if os.path.commonpath([full_path, self.directory]) != self.directory:
+            return None
+        return full_path
@@ -0,0 +1,66 @@
+"""
+Migration script to add the level_rank column to the alerts table.
+level_rank is the stored sort key used by AlertService.get_alerts; existing rows
+are backfilled from their level and the matching index is created.
+"""
+import sqlite3
+import os
+import sys
+
+# Get the database path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(script_dir)
+db_path = os.path.join(backend_dir, "dms_database.db")
+
+def migrate_database():
+    """Add level_rank to alerts, backfill it and index it"""
+    if not os.path.exists(db_path):
+        print(f"❌ Database not found at: {db_path}")
+        print("   The database will be created automatically when you start the backend.")
+        return
+    
+    print(f"📦 Migrating database: {db_path}")
+    
+    try:
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+        
+        cursor.execute("PRAGMA table_info(alerts)")
+        columns = [row[1] for row in cursor.fetchall()]
+        
+        if "level_rank" not in columns:
+            print("  ➕ Adding level_rank column...")
+            cursor.execute("ALTER TABLE alerts ADD COLUMN level_rank SMALLINT")
+        else:
+            print("  ✓ level_rank column already exists")
+        
+        cursor.execute("""
+            UPDATE alerts SET level_rank = CASE level
+                WHEN 'critical' THEN 1
+                WHEN 'warning' THEN 2
+                WHEN 'info' THEN 3
+                ELSE 4
+            END
+            WHERE level_rank IS NULL
+        """)
+        print(f"  🔄 Backfilled level_rank for {cursor.rowcount} alert(s)")
+        
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS ix_alerts_ack_rank_ts "
+            "ON alerts(acknowledged, level_rank, timestamp DESC)"
+        )
+        
+        conn.commit()
+        conn.close()
+        
+        print("✅ Migration completed successfully!")
+        
+    except sqlite3.Error as e:
+        print(f"❌ Database migration failed: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    migrate_database()
@@ -0,0 +1,71 @@
+"""
+Migration script to add the composite indexes declared in app/models.py.
+Base.metadata.create_all only creates indexes for new tables, so run this
+script once to add them to an existing database.
+"""
+import sqlite3
+import os
+import sys
+
+# Get the database path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(script_dir)
+db_path = os.path.join(backend_dir, "dms_database.db")
+
+# (index name, table, columns)
+INDEXES = [
+    ("ix_alerts_ack_ts", "alerts", "acknowledged, timestamp"),
+    ("ix_alerts_doc", "alerts", "document_id"),
+    ("ix_exceptions_resolved_raised", "exceptions", "resolved, raised_at"),
+    ("ix_documents_status_created", "documents", "status, created_at"),
+    ("ix_documents_category_client", "documents", "category, client"),
+    ("ix_doc_cat_pono", "documents", "category, po_number"),
+    ("ix_doc_cat_client_vendor_created", "documents", "category, client, vendor, created_at"),
+    ("ix_doc_cat_client_amount", "documents", "category, client, currency, amount"),
+    ("ix_doc_linked_to_cat", "documents", "linked_to, category"),
+    ("ix_documents_category_created_amount", "documents", "category, created_at, amount"),
+]
+
+def migrate_database():
+    """Create any missing composite indexes"""
+    if not os.path.exists(db_path):
+        print(f"❌ Database not found at: {db_path}")
+        print("   The database will be created automatically when you start the backend.")
+        return
+    
+    print(f"📦 Migrating database: {db_path}")
+    
+    try:
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+        
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+        existing = {row[0] for row in cursor.fetchall()}
+        
+        migrations_applied = []
+        
+        for name, table, columns in INDEXES:
+            if name not in existing:
+                print(f"  ➕ Adding index {name} on {table}({columns})...")
+                cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table}({columns})")
+                migrations_applied.append(name)
+            else:
+                print(f"  ✓ {name} already exists")
+        
+        conn.commit()
+        conn.close()
+        
+        if migrations_applied:
+            print(f"✅ Migration completed successfully! Added: {', '.join(migrations_applied)}")
+        else:
+            print("✅ Database is already up to date!")
+        
+    except sqlite3.Error as e:
+        print(f"❌ Database migration failed: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    migrate_database()
@@ -0,0 +1,57 @@
+"""
+Migration script to add the ingest_at and validated_at columns to the documents table.
+They record when an uploaded PDF started processing and when it was saved with its
+alerts; the dashboard's average processing time is computed from them.
+"""
+import sqlite3
+import os
+import sys
+
+# Get the database path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(script_dir)
+db_path = os.path.join(backend_dir, "dms_database.db")
+
+def migrate_database():
+    """Add ingest_at and validated_at to documents"""
+    if not os.path.exists(db_path):
+        print(f"❌ Database not found at: {db_path}")
+        print("   The database will be created automatically when you start the backend.")
+        return
+    
+    print(f"📦 Migrating database: {db_path}")
+    
+    try:
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+        
+        cursor.execute("PRAGMA table_info(documents)")
+        columns = [row[1] for row in cursor.fetchall()]
+        
+        migrations_applied = []
+        
+        for column in ("ingest_at", "validated_at"):
+            if column not in columns:
+                print(f"  ➕ Adding {column} column...")
+                cursor.execute(f"ALTER TABLE documents ADD COLUMN {column} DATETIME")
+                migrations_applied.append(column)
+            else:
+                print(f"  ✓ {column} column already exists")
+        
+        conn.commit()
+        conn.close()
+        
+        if migrations_applied:
+            print(f"✅ Migration completed successfully! Added: {', '.join(migrations_applied)}")
+        else:
+            print("✅ Database is already up to date!")
+        
+    except sqlite3.Error as e:
+        print(f"❌ Database migration failed: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    migrate_database()